@@ -0,0 +1,50 @@
+"""Micro-benchmark for agent and task construction cost.
+
+Compares building agents through their factories with reusing cached definitions from the
+agent registry, and times full task construction for a PID. No LLM calls are made.
+
+Usage: uv run python benchmarks/bench_agent_construction.py [--number N]
+"""
+
+import argparse
+import os
+import timeit
+from pathlib import Path
+
+from product_crew.crew.agents import create_product_manager_agent, create_jobs_to_be_done_expert_agent
+from product_crew.crew.registry import get_agent, clear_agent_registry
+from product_crew.crew.tasks import create_problem_understanding_analysis_task
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+    print(f"{label:<45} {seconds / number * 1e6:>10.1f} us/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200, help='Iterations per measurement')
+    args = parser.parse_args()
+
+    # Agents only need a key when they call the model
+    os.environ.setdefault('OPENAI_API_KEY', 'benchmark')
+    pid_path = ROOT / 'test' / 'pid.md'
+    requirements_path = ROOT / 'requirements'
+
+    for label, factory in (('Product Manager', create_product_manager_agent),
+                           ('Jobs-to-be-Done Expert', create_jobs_to_be_done_expert_agent)):
+        _report(f"{label}: factory", timeit.timeit(lambda: factory('gpt-4o'), number=args.number), args.number)
+
+        clear_agent_registry()
+        get_agent(factory, 'gpt-4o', stream=False)
+        _report(f"{label}: registry (warm)",
+                timeit.timeit(lambda: get_agent(factory, 'gpt-4o', stream=False), number=args.number), args.number)
+
+    _report("Problem understanding task (warm registry)",
+            timeit.timeit(lambda: create_problem_understanding_analysis_task(requirements_path, pid_path, False),
+                          number=args.number), args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,37 @@
 """Product Crew - CrewAI-based product initiative document processor."""
 
-__version__ = "0.1.0"
\ No newline at end of file
+__version__ = "0.1.0"
+
+from .errors import (
+    ProductCrewError,
+    InvalidInputError,
+    RefinementError,
+    RefinementCancelledError,
+    OutputWriteError
+)
+
+# Loaded on first access, so importing the package (e.g. for the CLI) does not import CrewAI
+_LAZY_EXPORTS = {
+    'refine_pid': '.api',
+    'refine_pid_sync': '.api',
+    'RefinementResult': '.crew',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'refine_pid',
+    'refine_pid_sync',
+    'RefinementResult',
+    'ProductCrewError',
+    'InvalidInputError',
+    'RefinementError',
+    'RefinementCancelledError',
+    'OutputWriteError'
+]
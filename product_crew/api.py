@@ -0,0 +1,82 @@
+"""Importable library API for refining PIDs from Python and asyncio code."""
+
+import asyncio
+import threading
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from .crew.runner import CrewCancelledError, RefinementResult, execute_refinement
+from .errors import ProductCrewError, RefinementCancelledError, RefinementError
+from .file_operations import load_environment
+from .validation import validate_requirements_path, validate_pid_path, validate_model, validate_api_key_for_model
+
+
+def _run_refinement(requirements_path: Path, pid_path: Path, overwrite: bool, model: str, stream: bool,
+                    write_output: bool, cancel_event: threading.Event,
+                    on_chunk: Optional[Callable[[str], None]], speculative_jtbd: bool,
+                    prescreen: bool, adaptive_limits: bool, max_iter: Optional[int],
+                    max_execution_time: Optional[int]) -> RefinementResult:
+    """Execute a refinement in a worker thread, translating failures into typed errors."""
+    try:
+        return execute_refinement(requirements_path, pid_path, overwrite, model=model, stream=stream,
+                                  write_output=write_output, cancel_event=cancel_event, on_chunk=on_chunk,
+                                  speculative_jtbd=speculative_jtbd, prescreen=prescreen,
+                                  adaptive_limits=adaptive_limits, max_iter=max_iter,
+                                  max_execution_time=max_execution_time)
+    except CrewCancelledError as e:
+        raise RefinementCancelledError(f"Refinement of {pid_path} was cancelled") from e
+    except ProductCrewError:
+        raise
+    except Exception as e:
+        raise RefinementError(f"Refinement of {pid_path} failed: {e}") from e
+
+
+async def refine_pid(requirements_path: Union[str, Path], pid_path: Union[str, Path], *,
+                     model: str = 'gpt-4o', overwrite: bool = False, stream: bool = False,
+                     write_output: bool = True, on_chunk: Optional[Callable[[str], None]] = None,
+                     executor: Optional[Executor] = None, speculative_jtbd: bool = False,
+                     prescreen: bool = True, adaptive_limits: bool = True, max_iter: Optional[int] = None,
+                     max_execution_time: Optional[int] = None) -> RefinementResult:
+    """Refine a PID and return its structured result.
+
+    The crew runs in a worker thread (the default executor unless one is given), so many
+    refinements can be awaited concurrently on one event loop. Cancelling the awaiting task
+    stops the crew at its next agent step, and the cancellation completes once the worker
+    thread has stopped, without writing the output. on_chunk receives streamed tokens
+    from the worker thread.
+    """
+    load_environment()
+
+    validated_requirements_path = validate_requirements_path(str(requirements_path))
+    validated_pid_path = validate_pid_path(str(pid_path))
+    validated_model = validate_model(model)
+    validate_api_key_for_model(validated_model)
+
+    cancel_event = threading.Event()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        executor, _run_refinement, validated_requirements_path, validated_pid_path, overwrite,
+        validated_model, stream, write_output, cancel_event, on_chunk, speculative_jtbd, prescreen,
+        adaptive_limits, max_iter, max_execution_time
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        # Wait for the worker thread to stop, so a cancelled run neither keeps spending tokens nor
+        # writes its output after the caller has moved on
+        await asyncio.wait([future])
+        raise
+
+
+def refine_pid_sync(requirements_path: Union[str, Path], pid_path: Union[str, Path], *,
+                    model: str = 'gpt-4o', overwrite: bool = False, stream: bool = False,
+                    write_output: bool = True, on_chunk: Optional[Callable[[str], None]] = None,
+                    speculative_jtbd: bool = False, prescreen: bool = True, adaptive_limits: bool = True,
+                    max_iter: Optional[int] = None, max_execution_time: Optional[int] = None) -> RefinementResult:
+    """Refine a PID from synchronous code; see refine_pid."""
+    return asyncio.run(refine_pid(requirements_path, pid_path, model=model, overwrite=overwrite, stream=stream,
+                                  write_output=write_output, on_chunk=on_chunk, speculative_jtbd=speculative_jtbd,
+                                  prescreen=prescreen, adaptive_limits=adaptive_limits, max_iter=max_iter,
+                                  max_execution_time=max_execution_time))
@@ -0,0 +1,20 @@
+"""Incremental build module for refining PID trees."""
+
+from .builder import build, discover_pids, BuildReport, BuildTarget
+from .manifest import load_manifest, save_manifest, MANIFEST_FILENAME
+from .scheduler import Job, RefinementScheduler, read_schedule_metadata, estimate_tokens, time_to_result_by_priority
+
+__all__ = [
+    'build',
+    'discover_pids',
+    'BuildReport',
+    'BuildTarget',
+    'load_manifest',
+    'save_manifest',
+    'MANIFEST_FILENAME',
+    'Job',
+    'RefinementScheduler',
+    'read_schedule_metadata',
+    'estimate_tokens',
+    'time_to_result_by_priority'
+]
@@ -0,0 +1,211 @@
+"""Make-style incremental refinement of every PID in a directory tree."""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import click
+
+from .manifest import FileHashCache, compute_inputs_digest, load_manifest, save_manifest
+from .scheduler import Job, RefinementScheduler, time_to_result_by_priority
+from ..errors import ProductCrewError
+from ..file_operations import load_environment
+from ..validation import validate_api_key_for_model
+
+REQUIREMENTS_DIRNAME = 'requirements'
+
+# Seconds between scans of the tree for PIDs that became stale while a build runs
+RESCAN_INTERVAL = 30.0
+
+# Date suffix of outputs written by get_output_file_path when not overwriting, e.g. my-initiative-2025-01-31.md
+GENERATED_OUTPUT_PATTERN = re.compile(r'-\d{4}-\d{2}-\d{2}$')
+
+
+@dataclass
+class BuildTarget:
+    """A PID to refine together with the inputs that determine its output."""
+
+    pid_path: Path
+    requirements_path: Path
+    digest: str
+
+
+@dataclass
+class BuildReport:
+    """Outcome of a build over a PID tree."""
+
+    up_to_date: List[Path] = field(default_factory=list)
+    refined: List[Path] = field(default_factory=list)
+    failed: Dict[Path, str] = field(default_factory=dict)
+    skipped: Dict[Path, str] = field(default_factory=dict)
+    connections: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    time_to_result: Dict[int, Dict[str, float]] = field(default_factory=dict)
+
+
+def _find_requirements(pid_path: Path, root: Path) -> Optional[Path]:
+    """Find the closest requirements folder between the PID's directory and the build root."""
+    for directory in (pid_path.parent, *pid_path.parent.parents):
+        candidate = directory / REQUIREMENTS_DIRNAME
+        if candidate.is_dir():
+            return candidate
+        if directory == root:
+            break
+    return None
+
+
+def _is_refine_output(path: Path) -> bool:
+    """Whether a dated file sits next to the undated PID it was refined from, e.g. launch-2025-01-31.md by launch.md."""
+    match = GENERATED_OUTPUT_PATTERN.search(path.stem)
+    return match is not None and path.with_name(f"{path.stem[:match.start()]}{path.suffix}").is_file()
+
+
+def discover_pids(root: Path, outputs: List[str]) -> List[Path]:
+    """List the PID sources under root, leaving out requirements folders and generated outputs.
+
+    Outputs are the paths recorded in the build manifest, plus dated copies written by
+    refine next to their source PID. A dated file without such a source is a PID itself.
+    """
+    recorded_outputs = set(outputs)
+    pids = []
+    for path in sorted(root.rglob('*.md')):
+        relative_parts = path.relative_to(root).parts
+        if any(part.startswith('.') or part == REQUIREMENTS_DIRNAME for part in relative_parts[:-1]):
+            continue
+        if str(path.relative_to(root)) in recorded_outputs or _is_refine_output(path):
+            continue
+        pids.append(path)
+    return pids
+
+
+def _find_stale(root: Path, targets: Dict, model: str, requirements_path: Optional[Path],
+                hash_cache: FileHashCache, report: BuildReport) -> List[BuildTarget]:
+    """List the PIDs under root whose inputs changed since the output recorded in targets."""
+    stale = []
+    recorded_outputs = [entry['output'] for entry in targets.values()]
+    for pid_path in discover_pids(root, recorded_outputs):
+        target_requirements = requirements_path or _find_requirements(pid_path, root)
+        if target_requirements is None:
+            report.skipped[pid_path] = f"no '{REQUIREMENTS_DIRNAME}' folder found"
+            continue
+
+        digest = compute_inputs_digest(pid_path, target_requirements, model, hash_cache)
+        entry = targets.get(str(pid_path.relative_to(root)))
+        if entry and entry['digest'] == digest and (root / entry['output']).exists():
+            report.up_to_date.append(pid_path)
+        else:
+            stale.append(BuildTarget(pid_path, target_requirements, digest))
+    return stale
+
+
+async def _refine_targets(root: Path, manifest: Dict, jobs: List[Job], model: str, workers: int,
+                          report: BuildReport, max_connections: Optional[int] = None,
+                          rescan: Optional[Callable[[Dict], List[BuildTarget]]] = None,
+                          rescan_interval: float = RESCAN_INTERVAL) -> None:
+    """Refine stale targets in scheduled order, recording each success in the manifest as it lands.
+
+    With rescan, the tree is scanned again every rescan_interval seconds and once the
+    queue drains; PIDs that became stale meanwhile are submitted, so an urgent one
+    preempts less urgent running work. The build ends when a scan finds nothing new.
+    """
+    from ..api import refine_pid
+    from ..crew.http_pool import configure_http_pool, http_pool_stats
+
+    if max_connections:
+        configure_http_pool(max_connections)
+
+    async def refine(job: Job) -> None:
+        target: BuildTarget = job.payload
+        relative_pid = str(target.pid_path.relative_to(root))
+        click.echo(f"Refining {relative_pid}")
+        try:
+            result = await refine_pid(target.requirements_path, target.pid_path, model=model)
+        except ProductCrewError as e:
+            report.failed[target.pid_path] = str(e)
+            click.echo(f"Failed {relative_pid}: {e}", err=True)
+            return
+
+        manifest['targets'][relative_pid] = {
+            'output': str(result.output_path.relative_to(root)),
+            'digest': target.digest,
+            'model': model,
+        }
+        # Saved after each target so an interrupted build keeps the work already done
+        save_manifest(root, manifest)
+        report.refined.append(target.pid_path)
+
+    scheduler = RefinementScheduler(refine, workers)
+
+    async def watch() -> None:
+        # Digests already submitted, so running and failed PIDs are only queued again once they change
+        submitted = {job.pid_path: job.payload.digest for job in jobs}
+        while True:
+            idle = await scheduler.wait_idle(rescan_interval)
+            try:
+                stale = await asyncio.to_thread(rescan, dict(manifest['targets']))
+            except OSError:
+                # A file changed mid-scan; the next scan sees it settled
+                stale = []
+            arrived = [target for target in stale if submitted.get(target.pid_path) != target.digest]
+            for target in arrived:
+                submitted[target.pid_path] = target.digest
+                try:
+                    job = Job.from_pid(target.pid_path, target)
+                except OSError:
+                    continue
+                click.echo(f"Queued {target.pid_path.relative_to(root)}")
+                await scheduler.submit(job)
+            if idle and not arrived:
+                await scheduler.close()
+                return
+
+    if rescan is None:
+        completed = await scheduler.run(jobs)
+    else:
+        completed, _ = await asyncio.gather(scheduler.run(jobs, close=False), watch())
+    report.time_to_result = time_to_result_by_priority(completed)
+    report.connections = http_pool_stats()
+
+
+def build(root: Path, model: str = 'gpt-4o', requirements_path: Optional[Path] = None, jobs: int = 4,
+          dry_run: bool = False, max_connections: Optional[int] = None,
+          rescan_interval: Optional[float] = RESCAN_INTERVAL) -> BuildReport:
+    """Refine every PID under root whose inputs changed since its last successful output.
+
+    Stale PIDs run by priority, then deadline, then estimated token cost, taken from
+    their front matter or header. While the build runs, the tree is scanned again every
+    rescan_interval seconds (never when 0 or None), and a PID that became stale in a higher
+    priority level preempts less urgent running work. Refinements share one keep-alive
+    connection pool per provider, capped at max_connections. Raises InvalidInputError
+    before refining anything when the model's API key is missing.
+    """
+    manifest = load_manifest(root)
+    hash_cache = FileHashCache(manifest['files'])
+    report = BuildReport()
+
+    stale = _find_stale(root, manifest['targets'], model, requirements_path, hash_cache, report)
+    manifest['files'] = hash_cache.used_records()
+
+    # Most urgent first: priority, then deadline, then shortest estimated job
+    scheduled = sorted(Job.from_pid(target.pid_path, target) for target in stale)
+
+    if dry_run:
+        report.refined.extend(job.pid_path for job in scheduled)
+        return report
+
+    if scheduled:
+        # Checked once up front, rather than failing every target on the same missing key
+        load_environment()
+        validate_api_key_for_model(model)
+
+        def rescan(targets: Dict) -> List[BuildTarget]:
+            return _find_stale(root, targets, model, requirements_path, FileHashCache(manifest['files']),
+                               BuildReport())
+
+        asyncio.run(_refine_targets(root, manifest, scheduled, model, jobs, report, max_connections,
+                                    rescan if rescan_interval else None, rescan_interval or RESCAN_INTERVAL))
+    else:
+        save_manifest(root, manifest)
+
+    return report
@@ -0,0 +1,98 @@
+"""Content-hash manifest recording the inputs behind each refined PID."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MANIFEST_FILENAME = '.product-crew-manifest.json'
+MANIFEST_VERSION = 1
+
+# Read from disk rather than imported, so a no-op build does not pay for importing CrewAI
+_TEMPLATE_SOURCES = (
+    Path(__file__).parent.parent / 'crew' / 'agents.py',
+    Path(__file__).parent.parent / 'crew' / 'tasks.py',
+    Path(__file__).parent.parent / 'crew' / 'prescreen.py',
+)
+
+_template_fingerprint: Optional[str] = None
+
+
+def load_manifest(root: Path) -> Dict[str, Any]:
+    """Load the build manifest for a PID tree, starting fresh if it is missing or unreadable."""
+    manifest_path = root / MANIFEST_FILENAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'files': {}, 'targets': {}}
+
+
+def save_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+    """Atomically write the build manifest for a PID tree."""
+    manifest_path = root / MANIFEST_FILENAME
+    temp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(temp_path, manifest_path)
+
+
+def template_fingerprint() -> str:
+    """Hash the agent, task and pre-screening definitions, so prompt changes invalidate previous outputs."""
+    global _template_fingerprint
+    if _template_fingerprint is None:
+        digest = hashlib.sha256()
+        for source in _TEMPLATE_SOURCES:
+            digest.update(source.read_bytes())
+        _template_fingerprint = digest.hexdigest()
+    return _template_fingerprint
+
+
+class FileHashCache:
+    """Content hashes of input files, reusing recorded hashes while size and mtime are unchanged."""
+
+    def __init__(self, records: Dict[str, Any]):
+        self.records = records
+        self._used: Dict[str, Any] = {}
+        self._directories: Dict[Path, str] = {}
+
+    def file_hash(self, path: Path) -> str:
+        """Return the SHA-256 of a file's content."""
+        stat = path.stat()
+        key = str(path)
+        record = self.records.get(key)
+        if not (record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size):
+            record = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                      'sha256': hashlib.sha256(path.read_bytes()).hexdigest()}
+        self._used[key] = record
+        return record['sha256']
+
+    def used_records(self) -> Dict[str, Any]:
+        """Records of the files hashed during this build, dropping files that are no longer inputs."""
+        return dict(self._used)
+
+    def directory_hash(self, directory: Path) -> str:
+        """Return a hash over the relative paths and contents of every file in a directory."""
+        if directory not in self._directories:
+            digest = hashlib.sha256()
+            for path in sorted(p for p in directory.rglob('*') if p.is_file()):
+                digest.update(str(path.relative_to(directory)).encode('utf-8'))
+                digest.update(self.file_hash(path).encode('ascii'))
+            self._directories[directory] = digest.hexdigest()
+        return self._directories[directory]
+
+
+def compute_inputs_digest(pid_path: Path, requirements_path: Path, model: str, hash_cache: FileHashCache) -> str:
+    """Combine every input of a refinement into a single digest."""
+    digest = hashlib.sha256()
+    for part in (
+        hash_cache.file_hash(pid_path),
+        hash_cache.directory_hash(requirements_path) if requirements_path.is_dir() else hash_cache.file_hash(requirements_path),
+        model,
+        template_fingerprint(),
+    ):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
@@ -0,0 +1,261 @@
+"""Priority-, deadline- and cost-aware scheduling of refinement jobs across workers."""
+
+import asyncio
+import heapq
+import itertools
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..crew.prescreen import prescreen_pid
+from ..metrics import percentile
+
+# Lower values run first; PIDs without a priority are 'normal'
+PRIORITY_LEVELS = {
+    'critical': 0, 'urgent': 0, 'p0': 0,
+    'high': 1, 'p1': 1,
+    'normal': 2, 'medium': 2, 'p2': 2,
+    'low': 3, 'p3': 3,
+}
+DEFAULT_PRIORITY = PRIORITY_LEVELS['normal']
+PRIORITY_NAMES = {0: 'critical', 1: 'high', 2: 'normal', 3: 'low'}
+
+# A job is restarted at most this many times after being preempted, so low priority work cannot starve
+MAX_PREEMPTIONS = 2
+
+# Rough size of the agent and task prompts around the PID content, and characters per token
+BASE_PROMPT_TOKENS = 3000
+CHARS_PER_TOKEN = 4
+
+# Without front matter, only the header of a PID (above its first section heading) is searched for metadata
+_HEADER_LINES = 40
+_FRONT_MATTER_PATTERN = re.compile(r'\A---\s*\n(.*?)\n---\s*(\n|\Z)', re.DOTALL)
+_HEADING_PATTERN = re.compile(r'^#{1,6}\s')
+# 'Priority: high' or '**Deadline**: 2026-11-01' on a line of its own, optionally followed by a YAML comment
+_FIELD_PATTERN = re.compile(r'^(?:\*\*|__)?(priority|deadline)(?:\*\*|__)?\s*:\s*(.+?)(?:\s+#.*)?$', re.IGNORECASE)
+
+
+def parse_priority(value: str) -> int:
+    """Map a priority name (critical, high, normal, low, P0-P3) or number onto a level."""
+    value = value.strip().lower()
+    if value in PRIORITY_LEVELS:
+        return PRIORITY_LEVELS[value]
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return DEFAULT_PRIORITY
+
+
+def parse_deadline(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date or date-time, None when it is not one."""
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
+def _header_lines(content: str) -> List[str]:
+    """Lines above the first section heading, after an optional leading title."""
+    lines = []
+    for number, line in enumerate(content.splitlines()[:_HEADER_LINES]):
+        if _HEADING_PATTERN.match(line):
+            if number == 0 and line.startswith('# '):
+                continue
+            break
+        lines.append(line)
+    return lines
+
+
+def read_schedule_metadata(content: str) -> Tuple[int, Optional[datetime]]:
+    """Read priority and deadline from YAML-style front matter or 'Priority:'/'Deadline:' header lines.
+
+    Fields in the body of the PID, such as a '**Priority**:' bullet in a section, are ignored.
+    """
+    front_matter = _FRONT_MATTER_PATTERN.match(content)
+    lines = front_matter.group(1).splitlines() if front_matter else _header_lines(content)
+
+    priority, deadline = DEFAULT_PRIORITY, None
+    for line in lines:
+        match = _FIELD_PATTERN.match(line.strip() if front_matter else line)
+        if not match:
+            continue
+        value = match.group(2).strip().strip('*_').strip('\'"')
+        if match.group(1).lower() == 'priority':
+            priority = parse_priority(value)
+        else:
+            deadline = parse_deadline(value) or deadline
+    return priority, deadline
+
+
+def estimate_tokens(content: str) -> int:
+    """Estimate prompt tokens of refining a PID; 0 when pre-screening will skip the model."""
+    result = prescreen_pid(content)
+    if result.skip_llm:
+        return 0
+    return BASE_PROMPT_TOKENS + len(result.filtered_content) // CHARS_PER_TOKEN
+
+
+@dataclass
+class Job:
+    """A unit of scheduled work, ordered by priority, then deadline, then estimated tokens."""
+
+    pid_path: Path
+    priority: int = DEFAULT_PRIORITY
+    deadline: Optional[datetime] = None
+    estimated_tokens: int = 0
+    payload: Any = None
+    sequence: int = 0
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    preemptions: int = 0
+    result: Any = None
+    error: Optional[BaseException] = None
+    _preempted: bool = field(default=False, repr=False)
+
+    @classmethod
+    def from_pid(cls, pid_path: Path, payload: Any = None) -> 'Job':
+        """Build a job from the PID's metadata and size."""
+        content = pid_path.read_text(encoding='utf-8', errors='replace')
+        priority, deadline = read_schedule_metadata(content)
+        return cls(pid_path, priority, deadline, estimate_tokens(content), payload)
+
+    def sort_key(self) -> Tuple:
+        deadline = self.deadline.timestamp() if self.deadline else math.inf
+        return (self.priority, deadline, self.estimated_tokens, self.sequence)
+
+    def __lt__(self, other: 'Job') -> bool:
+        return self.sort_key() < other.sort_key()
+
+    @property
+    def time_to_result(self) -> Optional[float]:
+        return self.finished_at - self.submitted_at if self.finished_at is not None else None
+
+    @property
+    def preemptible(self) -> bool:
+        return self.preemptions < MAX_PREEMPTIONS
+
+
+class RefinementScheduler:
+    """Run jobs on a fixed number of workers, always starting the most urgent queued job next.
+
+    Idle workers pull from one shared priority queue, so no worker sits idle while work
+    is queued anywhere. A job submitted while every worker is busy preempts the least
+    urgent running job of a strictly lower priority level, which is cancelled at its
+    next agent step and requeued. run_job must only return, or raise CancelledError,
+    once the job's work has stopped, so a preempted job never runs twice at once.
+    """
+
+    def __init__(self, run_job: Callable[[Job], Awaitable[Any]], workers: int = 4, preemption: bool = True):
+        self.run_job = run_job
+        self.workers = workers
+        self.preemption = preemption
+        self.completed: List[Job] = []
+        self._queue: List[Job] = []
+        self._running: Dict[int, Tuple[Job, asyncio.Task]] = {}
+        self._sequence = itertools.count()
+        self._closed = False
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _ensure_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def submit(self, job: Job) -> None:
+        """Queue a job, preempting lower priority work when every worker is busy."""
+        condition = self._ensure_condition()
+        async with condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit jobs to a closed scheduler")
+            job.sequence = next(self._sequence)
+            job.submitted_at = time.perf_counter()
+            heapq.heappush(self._queue, job)
+            if self.preemption and len(self._running) >= self.workers:
+                self._preempt_for(job)
+            # Every waiter is woken, since wait_idle callers share the condition with the workers
+            condition.notify_all()
+
+    def _preempt_for(self, job: Job) -> None:
+        candidates = [(running_job, task) for running_job, task in self._running.values()
+                      if running_job.priority > job.priority and running_job.preemptible and not running_job._preempted]
+        if candidates:
+            victim, task = max(candidates, key=lambda item: item[0].sort_key())
+            # A job that already finished keeps its result
+            if task.cancel():
+                victim._preempted = True
+
+    async def close(self) -> None:
+        """Signal that no more jobs will be submitted; workers stop once the queue drains."""
+        condition = self._ensure_condition()
+        async with condition:
+            self._closed = True
+            condition.notify_all()
+
+    async def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no job is queued or running, returning False when timeout seconds pass first."""
+        condition = self._ensure_condition()
+        async with condition:
+            try:
+                await asyncio.wait_for(condition.wait_for(lambda: not self._queue and not self._running), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def _worker(self) -> None:
+        condition = self._ensure_condition()
+        while True:
+            async with condition:
+                while not self._queue:
+                    if self._closed and not self._running:
+                        return
+                    await condition.wait()
+                job = heapq.heappop(self._queue)
+                job.started_at = job.started_at or time.perf_counter()
+                task = asyncio.ensure_future(self.run_job(job))
+                self._running[id(job)] = (job, task)
+
+            try:
+                job.result = await task
+            except asyncio.CancelledError:
+                if not job._preempted:
+                    raise
+            except Exception as e:
+                job.error = e
+
+            async with condition:
+                del self._running[id(job)]
+                if job._preempted:
+                    job._preempted = False
+                    job.preemptions += 1
+                    heapq.heappush(self._queue, job)
+                else:
+                    job.finished_at = time.perf_counter()
+                    self.completed.append(job)
+                condition.notify_all()
+
+    async def run(self, jobs: Optional[List[Job]] = None, close: bool = True) -> List[Job]:
+        """Run until the scheduler is closed and drained, returning the completed jobs in completion order.
+
+        With close=False, other coroutines can keep submitting jobs and close the scheduler later.
+        """
+        for job in jobs or []:
+            await self.submit(job)
+        if close:
+            await self.close()
+        await asyncio.gather(*(self._worker() for _ in range(self.workers)))
+        return self.completed
+
+
+def time_to_result_by_priority(jobs: List[Job]) -> Dict[int, Dict[str, float]]:
+    """Mean and p95 seconds from submission to result, per priority level."""
+    durations: Dict[int, List[float]] = {}
+    for job in jobs:
+        if job.time_to_result is not None:
+            durations.setdefault(job.priority, []).append(job.time_to_result)
+    return {priority: {'jobs': len(values), 'mean': sum(values) / len(values), 'p95': percentile(values, 95)}
+            for priority, values in sorted(durations.items())}
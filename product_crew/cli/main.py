@@ -1,14 +1,37 @@
 """Main CLI entry point for product crew application."""
 
+import json
 import sys
+from pathlib import Path
+from typing import Optional
 
 import click
 
 from ..validation import validate_requirements_path, validate_pid_path, validate_model, validate_api_key_for_model
-from ..crew import run_crew
+from ..build import build as build_pid_tree
+from ..build.scheduler import PRIORITY_NAMES
 
 
-@click.command()
+class DefaultCommandGroup(click.Group):
+    """Command group that falls back to a default command when no subcommand is named."""
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list) -> list:
+        # Keep `product-crew -r ... --pid ...` working alongside the subcommands
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup, default_command='refine')
+def cli() -> None:
+    """Product crew CLI application."""
+
+
+@cli.command()
 @click.option('-r', '--requirements', 'requirements_path', required=True,
               help='Path to the project requirements folder')
 @click.option('--pid', 'pid_path', required=True,
@@ -19,8 +42,22 @@ from ..crew import run_crew
               help='Enable interactive demo mode')
 @click.option('--model', default='gpt-4o',
               help='Model to use for agents (default: gpt-4o)')
-def cli(requirements_path: str, pid_path: str, overwrite: bool, demo: bool, model: str) -> None:
-    """Product crew CLI application."""
+@click.option('--stream', is_flag=True, default=False,
+              help='Stream agent output to the terminal and a partial file while the crew runs')
+@click.option('--speculative-jtbd', is_flag=True, default=False,
+              help='Start the Jobs-to-be-Done assessment alongside the Product Manager instead of on delegation')
+@click.option('--prescreen/--no-prescreen', default=True,
+              help='Send only sections with content, hint placeholder-only dimensions and skip the model for unfilled templates (default: on)')
+@click.option('--adaptive-limits/--fixed-limits', default=True,
+              help='Derive agent iteration caps and timeouts from the latency of previous runs (default: adaptive)')
+@click.option('--max-iter', default=None, type=click.IntRange(min=1),
+              help='Maximum iterations per agent, overriding the adaptive or default limit')
+@click.option('--max-execution-time', default=None, type=click.IntRange(min=1),
+              help='Maximum execution time per agent in seconds, overriding the adaptive or default limit')
+def refine(requirements_path: str, pid_path: str, overwrite: bool, demo: bool, model: str, stream: bool,
+           speculative_jtbd: bool, prescreen: bool, adaptive_limits: bool, max_iter: Optional[int],
+           max_execution_time: Optional[int]) -> None:
+    """Refine a single product initiative document (default command)."""
 
     try:
         # Validate arguments and get absolute paths
@@ -29,9 +66,206 @@ def cli(requirements_path: str, pid_path: str, overwrite: bool, demo: bool, mode
         validated_model = validate_model(model)
         validate_api_key_for_model(validated_model)
 
+        # Imported here so subcommands that never run the crew skip loading CrewAI
+        from ..crew import run_crew
+
         # Initialize and run CrewAI agent to print paths
-        run_crew(validated_requirements_path, validated_pid_path, overwrite, demo, validated_model)
+        run_crew(validated_requirements_path, validated_pid_path, overwrite, demo, validated_model, stream,
+                 speculative_jtbd, prescreen, adaptive_limits, max_iter, max_execution_time)
+
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('root', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('-r', '--requirements', 'requirements_path', default=None,
+              help="Requirements folder for every PID (default: closest 'requirements' folder above each PID)")
+@click.option('--model', default='gpt-4o',
+              help='Model to use for agents (default: gpt-4o)')
+@click.option('-j', '--jobs', default=4, show_default=True, type=click.IntRange(min=1),
+              help='Number of PIDs refined in parallel')
+@click.option('-n', '--dry-run', is_flag=True, default=False,
+              help='List the PIDs that would be refined without running the crew')
+@click.option('--max-connections', default=None, type=click.IntRange(min=1),
+              help='Maximum pooled HTTP connections per LLM provider (default: $PRODUCT_CREW_MAX_CONNECTIONS or 20)')
+@click.option('--rescan-interval', default=30.0, show_default=True, type=click.FloatRange(min=0),
+              help='Seconds between scans of ROOT for PIDs that became stale during the build; '
+                   'urgent ones preempt less urgent running PIDs (0: no rescans, no preemption)')
+def build(root: Path, requirements_path: str, model: str, jobs: int, dry_run: bool,
+          max_connections: Optional[int], rescan_interval: float) -> None:
+    """Refine only the PIDs under ROOT whose inputs changed since their last output."""
+
+    try:
+        validated_requirements_path = validate_requirements_path(requirements_path) if requirements_path else None
+        validated_model = validate_model(model)
+
+        report = build_pid_tree(root.resolve(), validated_model, validated_requirements_path, jobs, dry_run,
+                                max_connections, rescan_interval)
+
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
+    for pid_path, reason in report.skipped.items():
+        click.echo(f"Skipped {pid_path}: {reason}", err=True)
+    verb = 'Would refine' if dry_run else 'Refined'
+    click.echo(f"{len(report.up_to_date)} up to date, {verb.lower()} {len(report.refined)}, "
+               f"{len(report.failed)} failed, {len(report.skipped)} skipped")
+    if dry_run:
+        for pid_path in report.refined:
+            click.echo(f"{verb} {pid_path}")
+    for priority, stats in report.time_to_result.items():
+        click.echo(f"Priority {PRIORITY_NAMES.get(priority, priority)}: {stats['jobs']} PIDs, time to result "
+                   f"mean {stats['mean']:.1f}s, p95 {stats['p95']:.1f}s")
+    for provider, stats in report.connections.items():
+        if stats['requests']:
+            click.echo(f"{provider}: {stats['requests']} requests over {stats['connections_opened']} connections "
+                       f"({stats['reused']} reused, {stats['http2_requests']} HTTP/2)")
+
+    if report.failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('-r', '--requirements', 'requirements_path', required=True,
+              help='Path to the project requirements folder')
+@click.option('--pid', 'pid_path', required=True,
+              help='Path to the product initiative document (PID) to refine')
+@click.option('--model', default='gpt-4o',
+              help='Model to use for agents (default: gpt-4o)')
+@click.option('--runs', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Number of refinements profiled back to back')
+@click.option('--warmup', default=0, show_default=True, type=click.IntRange(min=0),
+              help='Unprofiled refinements run first, keeping lazy imports and first-use caches out of the report')
+@click.option('--top', default=25, show_default=True, type=click.IntRange(min=1),
+              help='Number of functions and allocation sites reported')
+@click.option('--sample-interval', default=None, type=click.FloatRange(min=0.1),
+              help='Also sample every thread\'s stack every N milliseconds for exact flame graph stacks')
+@click.option('--memory/--no-memory', default=True,
+              help='Trace allocations with tracemalloc (default: on)')
+@click.option('--prescreen/--no-prescreen', default=True,
+              help='Send only sections with content, hint placeholder-only dimensions and skip the model for unfilled templates (default: on)')
+@click.option('-o', '--output-dir', default='profile', show_default=True,
+              type=click.Path(file_okay=False, path_type=Path),
+              help='Folder for the pstats, collapsed-stack and allocation files')
+def profile(requirements_path: str, pid_path: str, model: str, runs: int, warmup: int, top: int,
+            sample_interval: Optional[float], memory: bool, prescreen: bool, output_dir: Path) -> None:
+    """Profile CPU time and memory of refining a PID, without writing its output."""
+
+    try:
+        validated_requirements_path = validate_requirements_path(requirements_path)
+        validated_pid_path = validate_pid_path(pid_path)
+        validated_model = validate_model(model)
+        validate_api_key_for_model(validated_model)
 
     except ValueError as e:
         click.echo(str(e), err=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+    # Imported before profiling starts so the one-off CrewAI import is not attributed to the run
+    from ..crew import execute_refinement
+    from ..file_operations import load_environment
+    from ..profiling import profile_refinement
+
+    load_environment()
+
+    # Fixed limits keep profiled runs comparable and out of the latency history used by refine and build
+    def workload() -> None:
+        execute_refinement(validated_requirements_path, validated_pid_path, False, model=validated_model,
+                           write_output=False, prescreen=prescreen, adaptive_limits=False)
+
+    try:
+        report = profile_refinement(workload, output_dir, runs, top,
+                                    sample_interval / 1000 if sample_interval else None, memory,
+                                    warmup=warmup)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(report.top_functions)
+    if report.top_allocations:
+        click.echo(f"Top {len(report.top_allocations)} allocation sites still held after the run "
+                   f"(peak {report.peak_memory / 1024:.1f} KiB):")
+        for entry in report.top_allocations:
+            click.echo(f"  {entry}")
+    click.echo(f"Profiled {report.runs} run(s) in {report.wall_time:.2f}s"
+               + (f" with {report.samples} stack samples" if report.samples else ''))
+    for kind, path in report.files.items():
+        click.echo(f"{kind}: {path}")
+
+
+@cli.command()
+@click.argument('root', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('-o', '--output', 'output_path', default='portfolio-report.md', show_default=True,
+              type=click.Path(dir_okay=False, path_type=Path),
+              help='Markdown file the portfolio report is written to')
+@click.option('--top-gaps', default=10, show_default=True, type=click.IntRange(min=1),
+              help='Number of most common priority gaps listed')
+def report(root: Path, output_path: Path, top_gaps: int) -> None:
+    """Summarize the latest assessment of every refined PID under ROOT in one portfolio report."""
+
+    from ..reporting import write_portfolio_report
+
+    try:
+        summary = write_portfolio_report(root.resolve(), output_path, top_gaps)
+    except OSError as e:
+        click.echo(f"Failed to create report {output_path}: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Portfolio report created: {output_path} ({summary.pids} PIDs)")
+
+
+@cli.command()
+@click.argument('pids', nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option('-r', '--requirements', 'requirements_path', required=True,
+              help='Path to the project requirements folder')
+@click.option('-m', '--model', 'models', multiple=True, required=True,
+              help='Model to compare; repeat the option for each model')
+@click.option('--runs', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Refinements of each PID per model, for steadier latency percentiles')
+@click.option('-j', '--jobs', default=4, show_default=True, type=click.IntRange(min=1),
+              help='Number of refinements run in parallel across all models')
+@click.option('--prescreen/--no-prescreen', default=False,
+              help='Pre-screen PIDs before sending them to each model, as refine does (default: off)')
+@click.option('--json', 'json_path', default=None, type=click.Path(dir_okay=False, path_type=Path),
+              help='Also write every run, summary and agreement figure to this JSON file')
+def compare(pids: tuple, requirements_path: str, models: tuple, runs: int, jobs: int, prescreen: bool,
+            json_path: Optional[Path]) -> None:
+    """Compare models on latency, tokens, cost and assessment agreement over PIDS (files or folders)."""
+
+    try:
+        validated_requirements_path = validate_requirements_path(requirements_path)
+        validated_models = list(dict.fromkeys(validate_model(model) for model in models))
+        for model in validated_models:
+            validate_api_key_for_model(model)
+
+        from ..comparison import compare_models, resolve_corpus, render_comparison_table
+
+        corpus = [validate_pid_path(str(pid_path)) for pid_path in resolve_corpus(list(pids))]
+        if not corpus:
+            raise ValueError("No PIDs found to compare")
+
+    except ValueError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
+    click.echo(f"Comparing {len(validated_models)} model(s) on {len(corpus)} PID(s), {runs} run(s) each")
+    report = compare_models(validated_requirements_path, corpus, validated_models, runs, jobs, prescreen)
+
+    for run in report.runs:
+        if run.error:
+            click.echo(f"Failed {run.model} on {run.pid_path}: {run.error}", err=True)
+    click.echo(render_comparison_table(report))
+
+    if json_path:
+        try:
+            json_path.write_text(json.dumps(report.to_dict(), indent=2), encoding='utf-8')
+        except OSError as e:
+            click.echo(f"Failed to write {json_path}: {e}", err=True)
+            sys.exit(1)
+        click.echo(f"Comparison written to {json_path}")
+
+    if any(summary.failures for summary in report.summaries):
+        sys.exit(1)
@@ -0,0 +1,21 @@
+"""Comparison module for running several models over a PID corpus."""
+
+from .harness import (
+    compare_models,
+    resolve_corpus,
+    render_comparison_table,
+    ComparisonReport,
+    ModelRun,
+    ModelSummary,
+    Agreement
+)
+
+__all__ = [
+    'compare_models',
+    'resolve_corpus',
+    'render_comparison_table',
+    'ComparisonReport',
+    'ModelRun',
+    'ModelSummary',
+    'Agreement'
+]
@@ -0,0 +1,266 @@
+"""Concurrent comparison of models over a PID corpus: latency, tokens, cost and assessment agreement."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..api import refine_pid
+from ..build import discover_pids
+from ..crew.assessment import DIMENSIONS, Assessment
+from ..errors import ProductCrewError
+from ..metrics import percentile
+
+LATENCY_PERCENTILES = (50, 90, 95)
+
+
+@dataclass
+class ModelRun:
+    """One refinement of one PID by one model."""
+
+    model: str
+    pid_path: Path
+    run: int
+    latency: Optional[float] = None
+    token_usage: Dict[str, int] = field(default_factory=dict)
+    cost: Optional[float] = None
+    assessment: Optional[Assessment] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ModelSummary:
+    """Latency, token and cost figures of one model over the corpus."""
+
+    model: str
+    runs: int
+    failures: int
+    latency: Dict[str, float] = field(default_factory=dict)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost: Optional[float] = None
+    average_score: Optional[float] = None
+
+
+@dataclass
+class Agreement:
+    """How closely two models' assessments match on the PIDs both assessed."""
+
+    models: List[str]
+    pids: int
+    status_agreement: Optional[float] = None
+    dimension_agreement: Dict[str, Optional[float]] = field(default_factory=dict)
+    score_mean_abs_diff: Optional[float] = None
+    readiness_agreement: Optional[float] = None
+
+
+@dataclass
+class ComparisonReport:
+    """Per-model summaries, pairwise agreement and the individual runs of a comparison."""
+
+    models: List[str]
+    pids: List[Path]
+    summaries: List[ModelSummary] = field(default_factory=list)
+    agreements: List[Agreement] = field(default_factory=list)
+    runs: List[ModelRun] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            'models': self.models,
+            'pids': [str(pid_path) for pid_path in self.pids],
+            'summaries': [asdict(summary) for summary in self.summaries],
+            'agreements': [asdict(agreement) for agreement in self.agreements],
+            'runs': [{
+                'model': run.model,
+                'pid': str(run.pid_path),
+                'run': run.run,
+                'latency': run.latency,
+                'token_usage': run.token_usage,
+                'cost': run.cost,
+                'overall_score': run.assessment.overall_score if run.assessment else None,
+                'readiness': run.assessment.readiness if run.assessment else None,
+                'statuses': run.assessment.statuses if run.assessment else None,
+                'error': run.error,
+            } for run in self.runs],
+        }
+
+
+def resolve_corpus(paths: List[Path]) -> List[Path]:
+    """Expand PID files and directories of PIDs into a sorted, de-duplicated corpus."""
+    corpus = set()
+    for path in paths:
+        if path.is_dir():
+            corpus.update(discover_pids(path.resolve(), []))
+        else:
+            corpus.add(path.resolve())
+    return sorted(corpus)
+
+
+def _estimate_cost(model: str, token_usage: Dict[str, int]) -> Optional[float]:
+    """Cost in USD from litellm's price list, None for models it does not price."""
+    import litellm
+
+    try:
+        prompt_cost, completion_cost = litellm.cost_per_token(
+            model=model,
+            prompt_tokens=token_usage.get('prompt_tokens', 0),
+            completion_tokens=token_usage.get('completion_tokens', 0),
+        )
+    except Exception:
+        return None
+    return prompt_cost + completion_cost
+
+
+async def _run_all(requirements_path: Path, corpus: List[Path], models: List[str], runs: int, jobs: int,
+                   prescreen: bool) -> List[ModelRun]:
+    """Refine every (model, PID, run) combination, at most jobs at a time."""
+    semaphore = asyncio.Semaphore(jobs)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        async def refine(model_run: ModelRun) -> ModelRun:
+            async with semaphore:
+                try:
+                    # Fixed limits keep the models' runs comparable and out of the latency history
+                    result = await refine_pid(requirements_path, model_run.pid_path, model=model_run.model,
+                                              write_output=False, executor=executor, prescreen=prescreen,
+                                              adaptive_limits=False)
+                except ProductCrewError as e:
+                    model_run.error = str(e)
+                    return model_run
+            model_run.latency = result.timings['total']
+            model_run.token_usage = result.token_usage
+            model_run.cost = _estimate_cost(model_run.model, result.token_usage)
+            model_run.assessment = result.assessment
+            return model_run
+
+        # Interleave models so none of them runs only at the start or the end of the comparison
+        pending = [ModelRun(model, pid_path, run)
+                   for run in range(1, runs + 1) for pid_path in corpus for model in models]
+        return list(await asyncio.gather(*(refine(model_run) for model_run in pending)))
+
+
+def _summarize(model: str, runs: List[ModelRun]) -> ModelSummary:
+    succeeded = [run for run in runs if run.error is None]
+    summary = ModelSummary(model=model, runs=len(runs), failures=len(runs) - len(succeeded))
+    if not succeeded:
+        return summary
+
+    latencies = [run.latency for run in succeeded]
+    summary.latency = {f"p{rank}": percentile(latencies, rank) for rank in LATENCY_PERCENTILES}
+    for run in succeeded:
+        summary.prompt_tokens += run.token_usage.get('prompt_tokens', 0)
+        summary.completion_tokens += run.token_usage.get('completion_tokens', 0)
+        summary.total_tokens += run.token_usage.get('total_tokens', 0)
+    costs = [run.cost for run in succeeded]
+    summary.cost = sum(costs) if all(cost is not None for cost in costs) else None
+    scores = [run.assessment.overall_score for run in succeeded if run.assessment.overall_score is not None]
+    summary.average_score = sum(scores) / len(scores) if scores else None
+    return summary
+
+
+def _ratio(matches: int, total: int) -> Optional[float]:
+    return matches / total if total else None
+
+
+def _compare_pair(first: str, second: str, assessments: Dict[str, Dict[Path, Assessment]]) -> Agreement:
+    """Agreement between two models on the first successful assessment of each PID both completed."""
+    shared = sorted(set(assessments[first]) & set(assessments[second]))
+    agreement = Agreement(models=[first, second], pids=len(shared))
+
+    dimension_matches = dict.fromkeys(DIMENSIONS, 0)
+    dimension_totals = dict.fromkeys(DIMENSIONS, 0)
+    score_diffs = []
+    readiness_matches = readiness_totals = 0
+    for pid_path in shared:
+        left, right = assessments[first][pid_path], assessments[second][pid_path]
+        for dimension in DIMENSIONS:
+            if left.statuses.get(dimension) and right.statuses.get(dimension):
+                dimension_totals[dimension] += 1
+                dimension_matches[dimension] += left.statuses[dimension] == right.statuses[dimension]
+        if left.overall_score is not None and right.overall_score is not None:
+            score_diffs.append(abs(left.overall_score - right.overall_score))
+        if left.readiness and right.readiness:
+            readiness_totals += 1
+            readiness_matches += left.readiness == right.readiness
+
+    agreement.dimension_agreement = {dimension: _ratio(dimension_matches[dimension], dimension_totals[dimension])
+                                     for dimension in DIMENSIONS}
+    agreement.status_agreement = _ratio(sum(dimension_matches.values()), sum(dimension_totals.values()))
+    agreement.score_mean_abs_diff = sum(score_diffs) / len(score_diffs) if score_diffs else None
+    agreement.readiness_agreement = _ratio(readiness_matches, readiness_totals)
+    return agreement
+
+
+def compare_models(requirements_path: Path, corpus: List[Path], models: List[str], runs: int = 1, jobs: int = 4,
+                   prescreen: bool = False) -> ComparisonReport:
+    """Refine the corpus with every model concurrently and compare latency, cost and assessments.
+
+    Prescreening is off by default, since locally decided statuses would agree across
+    models whatever they report. Agents run with the fixed default limits, and the runs
+    are not recorded in the latency history that refine and build adapt their limits to.
+    """
+    model_runs = asyncio.run(_run_all(requirements_path, corpus, models, runs, jobs, prescreen))
+    report = ComparisonReport(models=models, pids=corpus, runs=model_runs)
+
+    assessments: Dict[str, Dict[Path, Assessment]] = {model: {} for model in models}
+    for model in models:
+        runs_for_model = [run for run in model_runs if run.model == model]
+        report.summaries.append(_summarize(model, runs_for_model))
+        for run in sorted(runs_for_model, key=lambda item: item.run):
+            if run.assessment is not None:
+                assessments[model].setdefault(run.pid_path, run.assessment)
+
+    report.agreements = [_compare_pair(first, second, assessments) for first, second in combinations(models, 2)]
+    return report
+
+
+def _format(value: Optional[float], pattern: str) -> str:
+    return pattern.format(value) if value is not None else 'n/a'
+
+
+def _table(headers: List[str], rows: List[List[str]]) -> str:
+    widths = [max(len(header), *(len(row[index]) for row in rows)) for index, header in enumerate(headers)]
+    lines = ['  '.join(header.ljust(width) for header, width in zip(headers, widths)),
+             '  '.join('-' * width for width in widths)]
+    lines.extend('  '.join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows)
+    return '\n'.join(line.rstrip() for line in lines)
+
+
+def render_comparison_table(report: ComparisonReport) -> str:
+    """Plain-text tables of the per-model summaries and pairwise agreement."""
+    latency_headers = [f"p{rank} (s)" for rank in LATENCY_PERCENTILES]
+    summary_rows = [[
+        summary.model,
+        str(summary.runs),
+        str(summary.failures),
+        *(_format(summary.latency.get(f"p{rank}"), '{:.2f}') for rank in LATENCY_PERCENTILES),
+        str(summary.prompt_tokens),
+        str(summary.completion_tokens),
+        _format(summary.cost, '${:.4f}'),
+        _format(summary.average_score, '{:.1f}'),
+    ] for summary in report.summaries]
+    sections = [_table(['Model', 'Runs', 'Failed', *latency_headers, 'Prompt tok', 'Completion tok', 'Cost',
+                        'Avg score'], summary_rows)]
+
+    if report.agreements:
+        agreement_rows = [[
+            ' vs '.join(agreement.models),
+            str(agreement.pids),
+            _format(agreement.status_agreement, '{:.0%}'),
+            _format(agreement.readiness_agreement, '{:.0%}'),
+            _format(agreement.score_mean_abs_diff, '{:.2f}'),
+        ] for agreement in report.agreements]
+        sections.append(_table(['Models', 'PIDs', 'Status agreement', 'Readiness agreement', 'Score MAD'],
+                               agreement_rows))
+
+        dimension_rows = [[dimension, *(_format(agreement.dimension_agreement.get(dimension), '{:.0%}')
+                                        for agreement in report.agreements)]
+                          for dimension in DIMENSIONS]
+        sections.append(_table(['Dimension', *(' vs '.join(agreement.models) for agreement in report.agreements)],
+                               dimension_rows))
+
+    return '\n\n'.join(sections)
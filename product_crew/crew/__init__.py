@@ -1,11 +1,41 @@
 """Product Manager crew module."""
 
-from .runner import run_crew
-from .agents import create_product_manager_agent
-from .tasks import create_problem_understanding_analysis_task
+from .assessment import Assessment, parse_assessment, DIMENSIONS
+
+# Loaded on first access, so assessment parsing (e.g. for reports) does not import CrewAI
+_LAZY_EXPORTS = {
+    'run_crew': '.runner',
+    'execute_refinement': '.runner',
+    'RefinementResult': '.runner',
+    'create_product_manager_agent': '.agents',
+    'create_problem_understanding_analysis_task': '.tasks',
+    'get_agent': '.registry',
+    'clear_agent_registry': '.registry',
+    'configure_http_pool': '.http_pool',
+    'http_pool_stats': '.http_pool',
+    'close_http_pool': '.http_pool',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'run_crew',
+    'execute_refinement',
+    'RefinementResult',
     'create_product_manager_agent',
-    'create_problem_understanding_analysis_task'
-]
\ No newline at end of file
+    'create_problem_understanding_analysis_task',
+    'get_agent',
+    'clear_agent_registry',
+    'configure_http_pool',
+    'http_pool_stats',
+    'close_http_pool',
+    'Assessment',
+    'parse_assessment',
+    'DIMENSIONS'
+]
@@ -1,7 +1,11 @@
 """Product Manager agent for problem understanding analysis."""
 
 import os
-from crewai import Agent
+from typing import Type
+
+from crewai import Agent, LLM
+
+from .http_pool import get_llm_client, install_http_pool
 
 
 def _is_anthropic_model(model: str) -> bool:
@@ -19,7 +23,16 @@ def _configure_model(model: str) -> None:
         os.environ['MODEL'] = model
 
 
-def create_product_manager_agent(model: str = 'gpt-4o') -> Agent:
+def _create_llm(model: str, stream: bool = False) -> LLM:
+    """Create the LLM used by an agent, optionally streaming its tokens, over the shared connection pool."""
+    install_http_pool()
+    client = get_llm_client(model)
+    if client is None:
+        return LLM(model=model, stream=stream)
+    return LLM(model=model, stream=stream, client=client)
+
+
+def create_product_manager_agent(model: str = 'gpt-4o', stream: bool = False) -> Agent:
     """Create a Product Manager agent that analyzes problem understanding in PIDs."""
     _configure_model(model)
 
@@ -38,6 +51,7 @@ def create_product_manager_agent(model: str = 'gpt-4o') -> Agent:
             "job currently, how success would be measured, and how this fits within the broader service "
             "ecosystem. You never suggest solutions, but rather assess the quality of problem understanding."
         ),
+        llm=_create_llm(model, stream),
         verbose=True,
         allow_delegation=True,
         max_iter=5,
@@ -45,11 +59,12 @@ def create_product_manager_agent(model: str = 'gpt-4o') -> Agent:
     )
 
 
-def create_jobs_to_be_done_expert_agent(model: str = 'gpt-4o') -> Agent:
+def create_jobs_to_be_done_expert_agent(model: str = 'gpt-4o', stream: bool = False,
+                                        agent_class: Type[Agent] = Agent) -> Agent:
     """Create a Jobs-to-be-Done Expert agent for specialized JTBD analysis."""
     _configure_model(model)
 
-    return Agent(
+    return agent_class(
         role='Jobs-to-be-Done Expert',
         goal='Analyze Product Initiative Documents specifically from a Jobs-to-be-Done perspective to assess how well the user jobs, desired progress, and job context are understood',
         backstory=(
@@ -63,6 +78,7 @@ def create_jobs_to_be_done_expert_agent(model: str = 'gpt-4o') -> Agent:
             "outcomes, and job context. You never suggest solutions, only assess the depth of job "
             "understanding in problem statements."
         ),
+        llm=_create_llm(model, stream),
         verbose=True,
         allow_delegation=False,
         max_iter=3,
@@ -0,0 +1,81 @@
+"""Parsing of Problem Understanding Assessments produced by the crew."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+DIMENSIONS = (
+    'User and Customer Identification',
+    'Job-to-be-Done Understanding',
+    'Value Proposition Clarity',
+    'Competitive Landscape Analysis',
+    'Success Metrics Definition',
+    'Service Blueprint Context',
+)
+
+# Numeric value of each dimension status, so statuses can be averaged and compared across runs
+STATUS_SCORES = {
+    'Well Defined': 1.0,
+    'Partially Defined': 0.5,
+    'Not Defined': 0.0,
+    'Unclear': None,
+}
+
+_OVERALL_SCORE_PATTERN = re.compile(r'Problem Understanding Score\**\s*:?\s*\**\s*\[?\s*(\d+(?:\.\d+)?)\s*/\s*10', re.IGNORECASE)
+_READINESS_PATTERN = re.compile(r'Readiness for Solution Development\**\s*:?\s*\**\s*\[?\s*(Not Ready|Ready)', re.IGNORECASE)
+_DIMENSION_HEADING_PATTERN = re.compile(r'^#{2,6}\s*(\d)\.\s*(.+?)\s*$', re.MULTILINE)
+_STATUS_PATTERN = re.compile(r'\*\*Status\*\*\s*:?\s*\[?\s*(Well Defined|Partially Defined|Not Defined|Unclear)', re.IGNORECASE)
+_PRIORITY_GAPS_PATTERN = re.compile(r'^#{2,6}\s*Priority Gaps.*?$(.*?)(?=^#{2,6}\s|\Z)', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_GAP_ITEM_PATTERN = re.compile(r'^\s*\d+\.\s+(.+?)\s*$', re.MULTILINE)
+
+
+@dataclass
+class Assessment:
+    """Structured view of a Problem Understanding Assessment."""
+
+    overall_score: Optional[float] = None
+    readiness: Optional[str] = None
+    statuses: Dict[str, Optional[str]] = field(default_factory=dict)
+    priority_gaps: List[str] = field(default_factory=list)
+
+    @property
+    def dimension_scores(self) -> Dict[str, Optional[float]]:
+        """Numeric score per dimension, None when the status is missing or unclear."""
+        return {name: STATUS_SCORES.get(status) if status else None for name, status in self.statuses.items()}
+
+
+def _normalize_status(status: str) -> str:
+    """Map a parsed status onto its canonical spelling."""
+    for canonical in STATUS_SCORES:
+        if canonical.lower() == status.lower():
+            return canonical
+    return status
+
+
+def parse_assessment(content: str) -> Assessment:
+    """Parse scores, dimension statuses and priority gaps from an assessment document."""
+    assessment = Assessment(statuses={name: None for name in DIMENSIONS})
+
+    score_match = _OVERALL_SCORE_PATTERN.search(content)
+    if score_match:
+        assessment.overall_score = float(score_match.group(1))
+
+    readiness_match = _READINESS_PATTERN.search(content)
+    if readiness_match:
+        assessment.readiness = 'Not Ready' if readiness_match.group(1).lower() == 'not ready' else 'Ready'
+
+    headings = list(_DIMENSION_HEADING_PATTERN.finditer(content))
+    for index, heading in enumerate(headings):
+        number = int(heading.group(1))
+        if not 1 <= number <= len(DIMENSIONS):
+            continue
+        section_end = headings[index + 1].start() if index + 1 < len(headings) else len(content)
+        status_match = _STATUS_PATTERN.search(content, heading.end(), section_end)
+        if status_match:
+            assessment.statuses[DIMENSIONS[number - 1]] = _normalize_status(status_match.group(1))
+
+    gaps_match = _PRIORITY_GAPS_PATTERN.search(content)
+    if gaps_match:
+        assessment.priority_gaps = [item.group(1) for item in _GAP_ITEM_PATTERN.finditer(gaps_match.group(1))]
+
+    return assessment
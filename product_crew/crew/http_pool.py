@@ -0,0 +1,210 @@
+"""Process-wide, provider-keyed pool of keep-alive HTTP clients for LLM calls."""
+
+import importlib.util
+import os
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+import httpx
+import litellm
+
+MAX_CONNECTIONS_ENV = 'PRODUCT_CREW_MAX_CONNECTIONS'
+DEFAULT_MAX_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 90.0
+
+# Unread body left when a response is closed early; drained up to this size so the connection is reused
+MAX_DRAIN_BYTES = 64 * 1024
+
+# Providers whose litellm handler accepts an injected client, and the kind of client it expects
+_OPENAI_SDK_PROVIDERS = {'openai'}
+_HTTP_HANDLER_PROVIDERS = {'anthropic'}
+
+
+@dataclass
+class PoolStats:
+    """Connection reuse counters of one provider's client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    http2_requests: int = 0
+    _streams: Any = field(default_factory=weakref.WeakSet, repr=False)
+
+    @property
+    def reused(self) -> int:
+        """Requests served over an already open connection."""
+        return self.requests - self.connections_opened
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'requests': self.requests,
+            'connections_opened': self.connections_opened,
+            'reused': self.reused,
+            'http2_requests': self.http2_requests,
+        }
+
+
+class _DrainingStream(httpx.SyncByteStream):
+    """Response body that reads what is left of the body on close, instead of dropping the connection."""
+
+    def __init__(self, stream: httpx.SyncByteStream):
+        self._stream = stream
+        self._iterator: Optional[Iterator[bytes]] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._iterator = iter(self._stream)
+        yield from self._iterator
+
+    def close(self) -> None:
+        # litellm stops reading streamed completions at [DONE], before the chunked terminator
+        if self._iterator is not None:
+            drained = 0
+            for chunk in self._iterator:
+                drained += len(chunk)
+                if drained > MAX_DRAIN_BYTES:
+                    break
+        self._stream.close()
+
+
+class _DrainingTransport(httpx.BaseTransport):
+    """Transport whose responses drain their remaining body on close, keeping connections reusable."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        return httpx.Response(response.status_code, headers=response.headers,
+                              stream=_DrainingStream(response.stream), extensions=response.extensions)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+_clients: Dict[str, httpx.Client] = {}
+_llm_clients: Dict[str, Any] = {}
+_stats: Dict[str, PoolStats] = {}
+_lock = threading.Lock()
+_max_connections: Optional[int] = None
+_http2: Optional[bool] = None
+
+
+def http2_available() -> bool:
+    """Whether the optional h2 package is installed, so clients can negotiate HTTP/2."""
+    return importlib.util.find_spec('h2') is not None
+
+
+def configure_http_pool(max_connections: Optional[int] = None, http2: Optional[bool] = None) -> None:
+    """Set the pool limits; already pooled clients are closed so the next agents use the new ones."""
+    global _max_connections, _http2
+    close_http_pool()
+    with _lock:
+        _max_connections = max_connections
+        _http2 = http2
+
+
+def _pool_limits() -> httpx.Limits:
+    max_connections = _max_connections or int(os.getenv(MAX_CONNECTIONS_ENV, DEFAULT_MAX_CONNECTIONS))
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                        keepalive_expiry=KEEPALIVE_EXPIRY)
+
+
+def _track_response(stats: PoolStats) -> Any:
+    """Response hook counting requests and the distinct connections that served them."""
+    def hook(response: httpx.Response) -> None:
+        stream = response.extensions.get('network_stream')
+        with _lock:
+            stats.requests += 1
+            if response.http_version == 'HTTP/2':
+                stats.http2_requests += 1
+            if stream is None or stream not in stats._streams:
+                stats.connections_opened += 1
+                if stream is not None:
+                    stats._streams.add(stream)
+
+    return hook
+
+
+def get_http_client(provider: str) -> httpx.Client:
+    """Return the shared keep-alive client for a provider, creating it on first use."""
+    with _lock:
+        client = _clients.get(provider)
+        if client is None:
+            stats = _stats.setdefault(provider, PoolStats())
+            http2 = http2_available() if _http2 is None else _http2
+            transport = _DrainingTransport(httpx.HTTPTransport(limits=_pool_limits(), http2=http2))
+            client = httpx.Client(transport=transport, follow_redirects=True, timeout=httpx.Timeout(None),
+                                  event_hooks={'response': [_track_response(stats)]})
+            _clients[provider] = client
+        return client
+
+
+def _provider_for_model(model: str) -> Optional[str]:
+    try:
+        return litellm.get_llm_provider(model)[1]
+    except Exception:
+        return None
+
+
+def get_llm_client(model: str) -> Optional[Any]:
+    """Return a pooled client in the form litellm expects for the model's provider, if it takes one.
+
+    OpenAI calls go through an OpenAI SDK client and Anthropic calls through a litellm
+    HTTPHandler, both over the provider's shared httpx client. Other providers fall back
+    to litellm.client_session, which install_http_pool points at a shared client.
+    """
+    provider = _provider_for_model(model)
+    if provider not in _OPENAI_SDK_PROVIDERS | _HTTP_HANDLER_PROVIDERS:
+        return None
+
+    with _lock:
+        llm_client = _llm_clients.get(provider)
+    if llm_client is not None:
+        return llm_client
+
+    http_client = get_http_client(provider)
+    if provider in _OPENAI_SDK_PROVIDERS:
+        from openai import OpenAI
+
+        # Read when the first agent is built, after load_environment has populated the environment
+        llm_client = OpenAI(http_client=http_client,
+                            base_url=os.getenv('OPENAI_BASE_URL') or os.getenv('OPENAI_API_BASE') or None)
+    else:
+        from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+        llm_client = HTTPHandler(client=http_client)
+
+    with _lock:
+        return _llm_clients.setdefault(provider, llm_client)
+
+
+def install_http_pool() -> None:
+    """Point litellm's default sessions at the pool, so clients it builds itself also reuse connections."""
+    if litellm.client_session is None:
+        litellm.client_session = get_http_client('default')
+
+
+def http_pool_stats() -> Dict[str, Dict[str, int]]:
+    """Connection reuse statistics per provider since the pool was created."""
+    with _lock:
+        return {provider: stats.as_dict() for provider, stats in _stats.items()}
+
+
+def close_http_pool() -> None:
+    """Close every pooled connection and forget the clients and their statistics.
+
+    Cached agent definitions hold the closed clients, so the agent registry is cleared too.
+    """
+    from .registry import clear_agent_registry
+
+    clear_agent_registry()
+    with _lock:
+        clients = list(_clients.values())
+        if litellm.client_session in clients:
+            litellm.client_session = None
+        _clients.clear()
+        _llm_clients.clear()
+        _stats.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,223 @@
+"""Latency history per agent and model, and the execution limits derived from it."""
+
+import copy
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from crewai import Agent
+from crewai.events import crewai_event_bus
+from crewai.events.types.agent_events import (
+    AgentExecutionStartedEvent, AgentExecutionCompletedEvent, AgentExecutionErrorEvent
+)
+
+from ..metrics import percentile
+
+HISTORY_PATH = Path.home() / '.product-crew' / 'latency.json'
+HISTORY_WINDOW = 50
+MIN_SAMPLES = 5
+
+# Headroom over the observed p95, and bounds that keep derived limits sane
+SAFETY_FACTOR = 2.0
+MIN_EXECUTION_TIME = 30
+MAX_EXECUTION_TIME = 1800
+MIN_LLM_TIMEOUT = 15.0
+
+# Kinds of limit that can cut off a run, recognized from the error CrewAI reports
+EXECUTION_TIMEOUT = 'execution'
+LLM_CALL_TIMEOUT = 'llm_call'
+_EXECUTION_TIMEOUT_MARKER = 'execution timed out after'
+_LLM_TIMEOUT_MARKER = 'litellm.Timeout'
+
+
+@dataclass
+class AgentLimits:
+    """Iteration and time limits applied to an agent for one run."""
+
+    max_iter: int
+    max_execution_time: int
+    llm_timeout: Optional[float] = None
+
+
+class LatencyHistory:
+    """Rolling window of agent execution samples per (agent role, model), persisted as JSON."""
+
+    def __init__(self, path: Path = HISTORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._samples: Dict[str, List[Dict[str, Any]]] = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self._samples = {}
+
+    @staticmethod
+    def _key(role: str, model: str) -> str:
+        return f"{role}|{model}"
+
+    def samples(self, role: str, model: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._samples.get(self._key(role, model), []))
+
+    def record(self, role: str, model: str, duration: float, iterations: int, input_chars: int,
+               timed_out: Optional[str] = None, limit: Optional[float] = None) -> None:
+        """Add an execution sample and persist the history.
+
+        A run cut off by a limit is recorded with the kind of timeout and the limit in effect,
+        so the next derived limit can be loosened.
+        """
+        sample: Dict[str, Any] = {'duration': duration, 'iterations': iterations, 'input_chars': input_chars}
+        if timed_out is not None:
+            sample.update(timed_out=timed_out, limit=limit)
+        with self._lock:
+            window = self._samples.setdefault(self._key(role, model), [])
+            window.append(sample)
+            del window[:-HISTORY_WINDOW]
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_name(f"{self.path.name}.tmp")
+                temp_path.write_text(json.dumps(self._samples), encoding='utf-8')
+                os.replace(temp_path, self.path)
+            except OSError:
+                # History is an optimization; a read-only home must not fail the run
+                pass
+
+    def derive_limits(self, role: str, model: str, input_chars: int, defaults: AgentLimits) -> AgentLimits:
+        """Derive limits from the observed p95 duration and iterations, scaled to the input size.
+
+        Falls back to the defaults until MIN_SAMPLES executions have been recorded. A run
+        cut off by a limit leaves no sample of how long it needed, so every timeout in the
+        window raises that limit to at least SAFETY_FACTOR times the one that cut it off.
+        """
+        samples = self.samples(role, model)
+        if len(samples) < MIN_SAMPLES:
+            return defaults
+
+        typical_chars = percentile([sample['input_chars'] for sample in samples], 50) or 1
+        size_ratio = max(1.0, input_chars / typical_chars)
+
+        p95_duration = percentile([sample['duration'] for sample in samples], 95)
+        max_execution_time = int(min(MAX_EXECUTION_TIME,
+                                     max(MIN_EXECUTION_TIME, math.ceil(p95_duration * size_ratio * SAFETY_FACTOR))))
+
+        p95_iterations = percentile([sample['iterations'] for sample in samples], 95)
+        max_iter = int(min(defaults.max_iter * 2, max(2, math.ceil(p95_iterations) + 1)))
+
+        # A single hung call is cut off long before the whole execution budget is spent
+        p95_call = percentile([sample['duration'] / max(1, sample['iterations']) for sample in samples], 95)
+        llm_timeout = max(MIN_LLM_TIMEOUT, p95_call * size_ratio * SAFETY_FACTOR)
+
+        for sample in samples:
+            if sample.get('timed_out') == EXECUTION_TIMEOUT and sample.get('limit'):
+                max_execution_time = max(max_execution_time,
+                                         min(MAX_EXECUTION_TIME, math.ceil(sample['limit'] * SAFETY_FACTOR)))
+            elif sample.get('timed_out') == LLM_CALL_TIMEOUT and sample.get('limit'):
+                llm_timeout = max(llm_timeout, sample['limit'] * SAFETY_FACTOR)
+
+        return AgentLimits(max_iter=max_iter, max_execution_time=max_execution_time, llm_timeout=llm_timeout)
+
+
+_default_history: Optional[LatencyHistory] = None
+_default_history_lock = threading.Lock()
+
+
+def get_latency_history() -> LatencyHistory:
+    """Return the process-wide latency history backed by HISTORY_PATH."""
+    global _default_history
+    with _default_history_lock:
+        if _default_history is None:
+            _default_history = LatencyHistory()
+        return _default_history
+
+
+def apply_limits(agent: Agent, limits: AgentLimits) -> None:
+    """Apply run limits to an agent copy, giving it its own LLM when a call timeout is set."""
+    agent.max_iter = limits.max_iter
+    agent.max_execution_time = limits.max_execution_time
+    if limits.llm_timeout is not None and hasattr(agent.llm, 'timeout'):
+        # Registry copies share the template's LLM, so it is copied before being changed
+        agent.llm = copy.copy(agent.llm)
+        agent.llm.timeout = limits.llm_timeout
+
+
+# Started timestamps per agent id, shared by the process-wide event handlers
+_recorders: Dict[str, Dict[str, Any]] = {}
+_recorders_lock = threading.Lock()
+_handlers_registered = False
+
+
+def _on_started(source: Any, event: AgentExecutionStartedEvent) -> None:
+    recorder = _recorders.get(str(event.agent.id))
+    if recorder is not None:
+        recorder['started'] = time.perf_counter()
+
+
+def _on_completed(source: Any, event: AgentExecutionCompletedEvent) -> None:
+    recorder = _recorders.get(str(event.agent.id))
+    if recorder is None or recorder.get('started') is None:
+        return
+    duration = time.perf_counter() - recorder.pop('started')
+    iterations = getattr(event.agent.agent_executor, 'iterations', 1) or 1
+    recorder['history'].record(event.agent.role, recorder['model'], duration, iterations, recorder['input_chars'])
+
+
+def _timeout_kind(error: str) -> Optional[str]:
+    """Which limit cut off a run, None for failures that are not timeouts."""
+    if _EXECUTION_TIMEOUT_MARKER in error:
+        return EXECUTION_TIMEOUT
+    if error.startswith(_LLM_TIMEOUT_MARKER):
+        return LLM_CALL_TIMEOUT
+    return None
+
+
+def _on_error(source: Any, event: AgentExecutionErrorEvent) -> None:
+    recorder = _recorders.get(str(event.agent.id))
+    kind = _timeout_kind(event.error or '')
+    if recorder is None or recorder.get('started') is None or kind is None:
+        return
+    # CrewAI reports a cancelled run as an execution timeout; it says nothing about the limits
+    cancel_event = recorder['cancel_event']
+    if cancel_event is not None and cancel_event.is_set():
+        recorder.pop('started')
+        return
+    duration = time.perf_counter() - recorder.pop('started')
+    iterations = getattr(event.agent.agent_executor, 'iterations', 1) or 1
+    limit = event.agent.max_execution_time if kind == EXECUTION_TIMEOUT else getattr(event.agent.llm, 'timeout', None)
+    recorder['history'].record(event.agent.role, recorder['model'], duration, iterations, recorder['input_chars'],
+                               timed_out=kind, limit=limit)
+
+
+def _ensure_handlers_registered() -> None:
+    global _handlers_registered
+    with _recorders_lock:
+        if not _handlers_registered:
+            crewai_event_bus.register_handler(AgentExecutionStartedEvent, _on_started)
+            crewai_event_bus.register_handler(AgentExecutionCompletedEvent, _on_completed)
+            crewai_event_bus.register_handler(AgentExecutionErrorEvent, _on_error)
+            _handlers_registered = True
+
+
+@contextmanager
+def record_agent_latency(agents: List[Agent], history: LatencyHistory, model: str, input_chars: int,
+                         cancel_event: Optional[threading.Event] = None) -> Iterator[None]:
+    """Record the duration and iterations of each agent execution that completes or times out while the crew runs.
+
+    Executions stopped after cancel_event is set are not recorded as timeouts.
+    """
+    _ensure_handlers_registered()
+    agent_ids = [str(agent.id) for agent in agents]
+    with _recorders_lock:
+        for agent_id in agent_ids:
+            _recorders[agent_id] = {'history': history, 'model': model, 'input_chars': input_chars,
+                                    'cancel_event': cancel_event}
+    try:
+        yield
+    finally:
+        with _recorders_lock:
+            for agent_id in agent_ids:
+                _recorders.pop(agent_id, None)
@@ -0,0 +1,247 @@
+"""Local pre-screening of PIDs for sections that are still unfilled template skeleton."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .assessment import DIMENSIONS
+
+# Word prefixes in section titles that tie a PID section to exactly one assessment dimension
+DIMENSION_KEYWORDS: Dict[str, tuple] = {
+    'User and Customer Identification': ('user', 'customer', 'segment', 'persona', 'audience'),
+    'Job-to-be-Done Understanding': ('job', 'jtbd', 'need'),
+    'Value Proposition Clarity': ('value proposition', 'benefit', 'business impact', 'business case'),
+    'Competitive Landscape Analysis': ('competit', 'alternative', 'landscape'),
+    'Success Metrics Definition': ('metric', 'kpi', 'okr', 'measur'),
+    'Service Blueprint Context': ('service', 'ecosystem', 'touchpoint', 'journey', 'blueprint'),
+}
+_DIMENSION_PATTERNS = {
+    dimension: re.compile(r'\b(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')', re.IGNORECASE)
+    for dimension, keywords in DIMENSION_KEYWORDS.items()
+}
+
+# Sections under a heading like 'Solution Space' describe the solution, not the problem
+_SOLUTION_HEADING_PATTERN = re.compile(r'\bsolution', re.IGNORECASE)
+
+# Opening words of the guidance paragraphs in template/pid.md
+_TEMPLATE_GUIDANCE_PREFIXES = (
+    '💡',
+    'What problem are we solving?',
+    'Write down or link the reports',
+    'The second part describes the solution',
+    'Summarize how you intend to solve',
+    'Describe the first step',
+    'Describe the second step',
+    'Describe the third step',
+    'Describe the user flows',
+    'Whether customers will buy it',
+    'Whether users can figure out',
+    'Whether our engineers can build',
+    'Whether this solution also works',
+    # Footer of generate_pid_template
+    '*This document represents the collective analysis',
+)
+
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_PLACEHOLDER_LINE_PATTERNS = (
+    re.compile(r'^$'),
+    re.compile(r'^(-{3,}|\*{3,}|_{3,})$'),
+    # [Clear definition of the problem ...] and - **Target Market Size**: [TAM, SAM, SOM analysis]
+    re.compile(r'^([-*+]\s*)?(\*\*[^*]+\*\*:?\s*)?\[[^\]]*\]\.?$'),
+    # *[Product Manager Lead]* role tags and *Version: 1.0 | Iteration: 1/5 | ...* headers
+    re.compile(r'^\*\[[^\]]*\]\*$'),
+    re.compile(r'^\*Version:.*\*$'),
+)
+
+
+@dataclass
+class PidSection:
+    """A heading and the body text beneath it, up to the next heading.
+
+    A section has content when its own body or any of its subsections has real content.
+    """
+
+    title: str
+    level: int
+    body: str
+    has_content: bool
+
+
+@dataclass
+class PrescreenResult:
+    """Outcome of pre-screening a PID before sending it to the model."""
+
+    sections: List[PidSection] = field(default_factory=list)
+    undefined_dimensions: List[str] = field(default_factory=list)
+    filtered_content: str = ''
+
+    @property
+    def skip_llm(self) -> bool:
+        """Whether every dimension was decided locally, so no model call is needed."""
+        return len(self.undefined_dimensions) == len(DIMENSIONS)
+
+    @property
+    def sections_with_content(self) -> int:
+        return sum(1 for section in self.sections if section.has_content)
+
+    def summary(self) -> Dict[str, object]:
+        """Run statistics describing the pre-screening decision."""
+        return {
+            'sections': len(self.sections),
+            'sections_with_content': self.sections_with_content,
+            'undefined_dimensions': list(self.undefined_dimensions),
+            'llm_skipped': self.skip_llm,
+        }
+
+
+def _strip_guidance(body: str) -> str:
+    """Drop template guidance paragraphs and placeholder lines, keeping real content."""
+    kept_paragraphs = []
+    for paragraph in re.split(r'\n\s*\n', body):
+        stripped = paragraph.strip()
+        if not stripped or stripped.startswith(_TEMPLATE_GUIDANCE_PREFIXES):
+            continue
+        lines = [line for line in stripped.splitlines()
+                 if not any(pattern.match(line.strip()) for pattern in _PLACEHOLDER_LINE_PATTERNS)]
+        if lines:
+            kept_paragraphs.append('\n'.join(lines))
+    return '\n\n'.join(kept_paragraphs)
+
+
+def parse_sections(content: str) -> List[PidSection]:
+    """Split a PID into its markdown sections."""
+    sections: List[PidSection] = []
+    title, level, body_lines = '', 0, []
+
+    def close_section() -> None:
+        body = '\n'.join(body_lines)
+        if title or body.strip():
+            sections.append(PidSection(title, level, body, bool(_strip_guidance(body))))
+
+    for line in content.splitlines():
+        heading = _HEADING_PATTERN.match(line)
+        if heading:
+            close_section()
+            title, level, body_lines = heading.group(2), len(heading.group(1)), []
+        else:
+            body_lines.append(line)
+    close_section()
+
+    _propagate_subsection_content(sections)
+    return sections
+
+
+def _propagate_subsection_content(sections: List[PidSection]) -> None:
+    """Mark a heading as filled when any of its subsections has content."""
+    ancestors: List[PidSection] = []
+    for section in sections:
+        while ancestors and ancestors[-1].level >= section.level:
+            ancestors.pop()
+        if section.has_content:
+            for ancestor in ancestors:
+                ancestor.has_content = True
+        if section.title:
+            ancestors.append(section)
+
+
+def _problem_space_sections(sections: List[PidSection]) -> List[PidSection]:
+    """Sections outside solution-space headings and their subsections."""
+    kept, solution_level = [], None
+    for section in sections:
+        if solution_level is not None and section.level > solution_level:
+            continue
+        solution_level = section.level if _SOLUTION_HEADING_PATTERN.search(section.title) else None
+        if solution_level is None:
+            kept.append(section)
+    return kept
+
+
+def _dimensions_for(title: str) -> List[str]:
+    """List the assessment dimensions a section title is about."""
+    return [dimension for dimension, pattern in _DIMENSION_PATTERNS.items() if pattern.search(title)]
+
+
+def prescreen_pid(content: str) -> PrescreenResult:
+    """Find dimensions whose sections are unfilled skeleton and keep only sections with real content.
+
+    A dimension is flagged only when the whole PID is skeleton, or when every problem-space
+    section about it is placeholder-only; dimensions without a matching section are left to
+    the model. Apart from an entirely unfilled PID, the flags are hints for the model rather
+    than decided statuses.
+    """
+    sections = parse_sections(content)
+
+    if not any(section.has_content for section in sections):
+        undefined = list(DIMENSIONS)
+    else:
+        mapped: Dict[str, List[PidSection]] = {dimension: [] for dimension in DIMENSIONS}
+        for section in _problem_space_sections(sections):
+            for dimension in _dimensions_for(section.title):
+                mapped[dimension].append(section)
+        undefined = [dimension for dimension in DIMENSIONS
+                     if mapped[dimension] and not any(section.has_content for section in mapped[dimension])]
+
+    filtered_parts = []
+    for section in sections:
+        if section.has_content:
+            heading = f"{'#' * section.level} {section.title}" if section.title else ''
+            filtered_parts.append('\n\n'.join(part for part in (heading, _strip_guidance(section.body)) if part))
+
+    return PrescreenResult(sections=sections, undefined_dimensions=undefined,
+                           filtered_content='\n\n'.join(filtered_parts))
+
+
+def render_prescreen_instructions(result: PrescreenResult) -> str:
+    """Hints telling the model which dimensions only have placeholder sections."""
+    if not result.undefined_dimensions:
+        return ''
+    dimensions = '\n'.join(f"        - {dimension}" for dimension in result.undefined_dimensions)
+    return f"""
+        **Pre-screening Hints:**
+        The sections whose titles match these dimensions contain only template placeholders and were
+        left out of the content above. Still assess each dimension from the rest of the document,
+        since it may be covered under other headings:
+{dimensions}
+        """
+
+
+def render_prescreen_report(result: PrescreenResult) -> str:
+    """Markdown section recording the pre-screening decision in the output."""
+    undefined = ', '.join(result.undefined_dimensions) if result.undefined_dimensions else 'None'
+    return f"""
+### Local Pre-screening
+- **Sections with content sent to the model**: {result.sections_with_content} of {len(result.sections)}
+- **Dimensions with only placeholder sections**: {undefined}
+- **LLM analysis**: {'Skipped (the PID is an unfilled template)' if result.skip_llm else 'Run on sections with content'}
+"""
+
+
+def render_prescreened_assessment(result: PrescreenResult) -> str:
+    """Deterministic assessment for a PID whose every dimension was decided locally."""
+    dimensions = ''.join(f"""
+#### {number}. {dimension}
+**Status**: Not Defined
+**Findings**:
+- The sections covering this dimension contain only template placeholders or guidance text
+""" for number, dimension in enumerate(DIMENSIONS, start=1))
+    gaps = ''.join(f"{number}. **{dimension}**: No content has been written for this dimension yet\n"
+                   for number, dimension in enumerate(result.undefined_dimensions[:3], start=1))
+
+    return f"""## Problem Understanding Assessment
+
+### Overall Assessment
+- **Problem Understanding Score**: 0/10 - The PID is still an unfilled template
+- **Readiness for Solution Development**: Not Ready - No problem understanding has been documented yet
+
+### Detailed Analysis by Dimension
+{dimensions}
+### Priority Gaps for Problem Understanding
+{gaps}
+### Strengths in Current Problem Understanding
+- None documented yet
+
+### Next Steps for Problem Understanding
+- Replace the template placeholders with what is known about users, their jobs, value, alternatives, metrics and service context
+{render_prescreen_report(result)}
+**Note**: This assessment was produced locally without a model call and does not suggest any solutions.
+"""
@@ -0,0 +1,56 @@
+"""Registry of agent definitions reused across tasks and runs."""
+
+import threading
+import uuid
+from typing import Any, Callable, Dict, Tuple
+
+from crewai import Agent
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.agents.tools_handler import ToolsHandler
+
+_templates: Dict[Tuple, Agent] = {}
+_templates_lock = threading.Lock()
+
+
+def _agent_key(factory: Callable[..., Agent], model: str, config: Dict[str, Any]) -> Tuple:
+    """Key an agent definition by its factory (and so its role), model and configuration."""
+    return (factory.__module__, factory.__qualname__, model, tuple(sorted(config.items(), key=lambda item: item[0])))
+
+
+def _fresh_copy(template: Agent) -> Agent:
+    """Copy a template agent without re-validating it, giving the copy its own execution state.
+
+    CrewAI mutates agents while a crew runs (crew, executor, step callback, token counters),
+    so templates are never handed out directly.
+    """
+    agent = template.model_copy(update={
+        'id': uuid.uuid4(),
+        'tools': list(template.tools or []),
+        'tools_results': [],
+        'tools_handler': ToolsHandler(),
+        'agent_executor': None,
+        'crew': None,
+        'step_callback': None,
+    })
+    agent._token_process = TokenProcess()
+    agent._times_executed = 0
+    return agent
+
+
+def get_agent(factory: Callable[..., Agent], model: str = 'gpt-4o', **config: Any) -> Agent:
+    """Return an agent for (role, model, config), building its definition only once per process."""
+    key = _agent_key(factory, model, config)
+    template = _templates.get(key)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(key)
+            if template is None:
+                template = factory(model, **config)
+                _templates[key] = template
+    return _fresh_copy(template)
+
+
+def clear_agent_registry() -> None:
+    """Drop every cached agent definition."""
+    with _templates_lock:
+        _templates.clear()
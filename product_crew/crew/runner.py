@@ -1,48 +1,263 @@
 """Product Manager crew execution for problem understanding analysis."""
 
+import sys
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from crewai import Crew
-from .tasks import create_problem_understanding_analysis_task
-from .agents import create_product_manager_agent
-from ..file_operations import load_environment, get_output_file_path, create_pid_file
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import click
+from crewai import Agent, Crew
+from .assessment import Assessment, parse_assessment
+from .tasks import create_problem_understanding_analysis_task, read_pid_content
+from .agents import create_jobs_to_be_done_expert_agent
+from .registry import get_agent
+from .latency import AgentLimits, LatencyHistory, apply_limits, get_latency_history, record_agent_latency
+from .prescreen import PrescreenResult, prescreen_pid, render_prescreen_report, render_prescreened_assessment
+from .speculation import JobsToBeDoneSpeculation, SpeculativeAgent
+from .streaming import stream_agent_output
+from ..errors import OutputWriteError
+from ..file_operations import load_environment, get_output_file_path, get_partial_file_path, write_pid_file
+
+
+class CrewCancelledError(TimeoutError):
+    """Raised inside the crew when its run has been cancelled.
+
+    Subclasses TimeoutError so CrewAI stops the task instead of retrying it. Agents with
+    an execution timeout report it as a new "execution timed out" TimeoutError, so the
+    crew's error is raised again as a CrewCancelledError once the run's cancel event is set.
+    """
+
+
+@dataclass
+class RefinementResult:
+    """Outcome of a PID refinement run."""
+
+    content: str
+    model: str
+    output_path: Optional[Path] = None
+    assessment: Assessment = field(default_factory=Assessment)
+    timings: Dict[str, float] = field(default_factory=dict)
+    token_usage: Dict[str, int] = field(default_factory=dict)
+    speculation: Optional[str] = None
+    prescreen: Optional[Dict[str, Any]] = None
+    limits: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def scores(self) -> Dict[str, Optional[float]]:
+        """Numeric score per assessment dimension."""
+        return self.assessment.dimension_scores
+
+
+def _cancellation_step_callback(*cancel_events: threading.Event) -> Callable[[Any], None]:
+    """Build a step callback that stops the crew at the next step once cancellation is requested."""
+    def step_callback(step: Any) -> None:
+        if any(cancel_event.is_set() for cancel_event in cancel_events):
+            raise CrewCancelledError("Refinement cancelled")
+
+    return step_callback
+
+
+def _merge_token_usage(*usages: Dict[str, int]) -> Dict[str, int]:
+    """Sum token usage counters from several crews."""
+    merged: Dict[str, int] = {}
+    for usage in usages:
+        for key, value in usage.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _configure_limits(agents: List[Agent], model: str, input_chars: int, history: Optional[LatencyHistory],
+                      max_iter: Optional[int], max_execution_time: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Apply learned (or default) limits to each agent, with explicit overrides taking precedence."""
+    applied = {}
+    for agent in agents:
+        limits = AgentLimits(agent.max_iter, agent.max_execution_time)
+        if history is not None:
+            limits = history.derive_limits(agent.role, model, input_chars, limits)
+        if max_iter is not None:
+            limits.max_iter = max_iter
+        if max_execution_time is not None:
+            limits.max_execution_time = max_execution_time
+        apply_limits(agent, limits)
+        applied[agent.role] = asdict(limits)
+    return applied
+
+
+def _run_analysis_crew(requirements_path: Path, pid_path: Path, overwrite: bool, demo: bool, model: str,
+                       stream: bool, cancel_event: threading.Event, partial_path: Optional[Path],
+                       on_chunk: Optional[Callable[[str], None]], speculative_jtbd: bool,
+                       prescreen: Optional[PrescreenResult], history: Optional[LatencyHistory],
+                       max_iter: Optional[int], max_execution_time: Optional[int]
+                       ) -> Tuple[str, Dict[str, int], Optional[str], Dict[str, Dict[str, Any]]]:
+    """Kick off the analysis crew and return its content, token usage, speculation outcome and limits."""
+    # Create problem understanding analysis task; the crew reuses its agent so usage metrics cover the run
+    task = create_problem_understanding_analysis_task(requirements_path, pid_path, overwrite, model, stream, prescreen)
+    agent = task.agent
+
+    # The JTBD expert is a crew member so the manager's delegation tools can reach it
+    expert = get_agent(
+        create_jobs_to_be_done_expert_agent, model,
+        stream=stream, agent_class=SpeculativeAgent if speculative_jtbd else Agent
+    )
+
+    input_chars = len(prescreen.filtered_content) if prescreen else len(read_pid_content(pid_path))
+    limits = _configure_limits([agent, expert], model, input_chars, history, max_iter, max_execution_time)
+
+    # Create and run crew
+    crew = Crew(
+        agents=[agent, expert],
+        tasks=[task],
+        verbose=demo,
+        step_callback=_cancellation_step_callback(cancel_event)
+    )
+
+    if cancel_event.is_set():
+        raise CrewCancelledError("Refinement cancelled")
+
+    speculation = None
+    if speculative_jtbd:
+        # Stopped once the manager finishes, in case it never delegates
+        speculation_done = threading.Event()
+        speculation = JobsToBeDoneSpeculation.start(
+            pid_path, read_pid_content(pid_path), model, stream,
+            _cancellation_step_callback(cancel_event, speculation_done)
+        )
+        expert.attach_speculation(speculation)
+
+    try:
+        with ExitStack() as stack:
+            if partial_path:
+                # Stream tokens to a partial file as they arrive; it survives a crash mid-run
+                stack.enter_context(stream_agent_output([agent, expert], partial_path, on_chunk))
+            if history is not None:
+                stack.enter_context(record_agent_latency([agent, expert], history, model, input_chars, cancel_event))
+            try:
+                result = crew.kickoff()
+            except Exception as e:
+                if cancel_event.is_set():
+                    raise CrewCancelledError("Refinement cancelled") from e
+                raise
+    finally:
+        if speculation is not None:
+            speculation_done.set()
+            speculation.shutdown()
+
+    token_usage = result.token_usage.model_dump() if getattr(result, 'token_usage', None) else {}
+    if speculation is None:
+        return str(result), token_usage, None, limits
+    return str(result), _merge_token_usage(token_usage, speculation.token_usage()), speculation.status, limits
+
+
+def execute_refinement(requirements_path: Path, pid_path: Path, overwrite: bool, demo: bool = False,
+                       model: str = 'gpt-4o', stream: bool = False, write_output: bool = True,
+                       cancel_event: Optional[threading.Event] = None,
+                       on_chunk: Optional[Callable[[str], None]] = None,
+                       speculative_jtbd: bool = False, prescreen: bool = True, adaptive_limits: bool = True,
+                       max_iter: Optional[int] = None,
+                       max_execution_time: Optional[int] = None) -> RefinementResult:
+    """Run the Product Manager crew on a PID and return the structured result.
+
+    With speculative_jtbd, the Jobs-to-be-Done assessment starts alongside the Product
+    Manager and answers its delegation, instead of adding a serial round trip. With
+    prescreen, only sections with real content are sent to the model, along with hints
+    about dimensions whose sections are unfilled template, and the model is skipped
+    entirely when the whole PID is unfilled template. With adaptive_limits,
+    agent iteration caps and timeouts come from the latency history of previous runs;
+    max_iter and max_execution_time override them for every agent.
+    """
+    started = time.perf_counter()
+    cancel_event = cancel_event or threading.Event()
+    stream = stream or on_chunk is not None
+
+    # Determine output file path
+    output_path = get_output_file_path(pid_path, overwrite) if write_output else None
+    partial_path = get_partial_file_path(output_path) if stream and output_path else None
+
+    prescreen_result = prescreen_pid(read_pid_content(pid_path)) if prescreen else None
+    setup_done = time.perf_counter()
+
+    token_usage: Dict[str, int] = {}
+    speculation_status = None
+    limits: Dict[str, Dict[str, Any]] = {}
+    if prescreen_result is not None and prescreen_result.skip_llm:
+        analysis_content = render_prescreened_assessment(prescreen_result)
+        partial_path = None
+    else:
+        analysis_content, token_usage, speculation_status, limits = _run_analysis_crew(
+            requirements_path, pid_path, overwrite, demo, model, stream, cancel_event, partial_path,
+            on_chunk, speculative_jtbd, prescreen_result, get_latency_history() if adaptive_limits else None,
+            max_iter, max_execution_time
+        )
+        if prescreen_result is not None:
+            analysis_content += render_prescreen_report(prescreen_result)
+    kickoff_done = time.perf_counter()
+
+    # A run cancelled after its last agent step must not write its output
+    if cancel_event.is_set():
+        raise CrewCancelledError("Refinement cancelled")
+
+    # Save analysis results to output file
+    if output_path:
+        try:
+            write_pid_file(output_path, analysis_content, partial_path)
+        except (IOError, OSError, PermissionError) as e:
+            raise OutputWriteError(f"Failed to create file {output_path}: {e}") from e
+    finished = time.perf_counter()
+
+    assessment = parse_assessment(analysis_content)
+
+    return RefinementResult(
+        content=analysis_content,
+        model=model,
+        output_path=output_path,
+        assessment=assessment,
+        timings={
+            'setup': setup_done - started,
+            'kickoff': kickoff_done - setup_done,
+            'write': finished - kickoff_done,
+            'total': finished - started,
+        },
+        token_usage=token_usage,
+        speculation=speculation_status,
+        prescreen=prescreen_result.summary() if prescreen_result is not None else None,
+        limits=limits
+    )
 
 
 def run_crew(requirements_path: Path, pid_path: Path, overwrite: bool, demo: bool = False,
-             model: str = 'gpt-4o') -> None:
+             model: str = 'gpt-4o', stream: bool = False, speculative_jtbd: bool = False,
+             prescreen: bool = True, adaptive_limits: bool = True, max_iter: Optional[int] = None,
+             max_execution_time: Optional[int] = None) -> None:
     """Run Product Manager crew to analyze problem understanding in PID."""
     try:
         load_environment()
-        
-        # Determine output file path
-        output_path = get_output_file_path(pid_path, overwrite)
-        
-        # Create problem understanding analysis task and agent
-        task = create_problem_understanding_analysis_task(requirements_path, pid_path, overwrite, model)
-        agent = create_product_manager_agent(model)
-        
-        # Create and run crew
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            verbose=demo
-        )
-        
-        # Execute the crew
-        result = crew.kickoff()
-        
-        # Save analysis results to output file
-        analysis_content = str(result)
-        create_pid_file(output_path, analysis_content)
-        
+
+        result = execute_refinement(requirements_path, pid_path, overwrite, demo, model, stream,
+                                     speculative_jtbd=speculative_jtbd, prescreen=prescreen,
+                                     adaptive_limits=adaptive_limits, max_iter=max_iter,
+                                     max_execution_time=max_execution_time)
+        click.echo(f"PID file created: {result.output_path}")
+        if result.prescreen:
+            undefined = ', '.join(result.prescreen['undefined_dimensions']) or 'none'
+            skipped = ' (LLM analysis skipped)' if result.prescreen['llm_skipped'] else ''
+            click.echo(f"Placeholder-only sections for: {undefined}{skipped}")
+
         # Print the expected output format
         print(str(requirements_path))
         print(str(pid_path))
         print(overwrite)
-        
+
+    except OutputWriteError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
     except Exception as e:
         print(f"Error: {e}")
-        
+
         # Print the expected output format even on error
         print(str(requirements_path))
         print(str(pid_path))
-        print(overwrite)
\ No newline at end of file
+        print(overwrite)
@@ -0,0 +1,119 @@
+"""Speculative Jobs-to-be-Done analysis started alongside the Product Manager."""
+
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from crewai import Agent, Crew, Task
+from pydantic import PrivateAttr
+
+from .tasks import create_jobs_to_be_done_assessment_task
+
+# A delegation is served from the speculative run only when it asks for a Jobs-to-be-Done assessment
+_JTBD_PATTERN = re.compile(r'\b(jobs?[- ]to[- ]be[- ]done|jtbd)\b', re.IGNORECASE)
+_ASSESSMENT_PATTERN = re.compile(r'\b(assess|analy[sz]|evaluat|review)', re.IGNORECASE)
+
+
+def matches_speculated_task(request: str) -> bool:
+    """Whether a delegated request asks for the Jobs-to-be-Done assessment that was speculated."""
+    return bool(_JTBD_PATTERN.search(request) and _ASSESSMENT_PATTERN.search(request))
+
+
+def _digest(content: str) -> str:
+    """Hash PID content so a speculative result can be checked against the current file."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class JobsToBeDoneSpeculation:
+    """A Jobs-to-be-Done assessment started at kickoff, before the manager asks for it.
+
+    The crew starts running in a background thread as soon as the speculation is created.
+    """
+
+    def __init__(self, pid_path: Path, pid_content: str, crew: Crew):
+        self.pid_path = pid_path
+        self.status = 'pending'
+        self.crew = crew
+        self._pid_digest = _digest(pid_content)
+        self._lock = threading.Lock()
+        self._consumed = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jtbd-speculation')
+        self._future = self._executor.submit(self.crew.kickoff)
+
+    @classmethod
+    def start(cls, pid_path: Path, pid_content: str, model: str, stream: bool,
+              step_callback: Callable[[Any], None]) -> 'JobsToBeDoneSpeculation':
+        """Start the Jobs-to-be-Done assessment crew of a PID."""
+        task = create_jobs_to_be_done_assessment_task(pid_content, model, stream)
+        return cls(pid_path, pid_content, Crew(agents=[task.agent], tasks=[task], step_callback=step_callback))
+
+    def _is_stale(self) -> bool:
+        """Check whether the PID changed on disk since the speculative run started."""
+        try:
+            return _digest(self.pid_path.read_text(encoding='utf-8')) != self._pid_digest
+        except OSError:
+            return True
+
+    def take_result(self, request: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Return the speculative result for the first matching delegation, or None to delegate live.
+
+        Waiting on the in-flight run is never slower than starting a fresh one. Requests
+        for anything but a Jobs-to-be-Done assessment, and every delegation after the one
+        served, are follow-up questions, so they run live.
+        """
+        if not matches_speculated_task(request):
+            return None
+        with self._lock:
+            if self._consumed:
+                return None
+            self._consumed = True
+
+        if self._is_stale():
+            self.status = 'stale'
+            return None
+        try:
+            result = str(self._future.result(timeout=timeout))
+        except Exception:
+            self.status = 'failed'
+            return None
+
+        self.status = 'used'
+        return result
+
+    def token_usage(self) -> Dict[str, int]:
+        """Token usage of the speculative run, including a run that failed or was stopped early.
+
+        Read after shutdown, so the usage of a run still in flight is not left out.
+        """
+        return self.crew.calculate_usage_metrics().model_dump()
+
+    def shutdown(self) -> None:
+        """Wait for the speculation thread to stop.
+
+        An unused run is cancelled by its step callback once the manager finishes, so
+        this waits at most for the agent step in flight.
+        """
+        if self.status == 'pending':
+            self.status = 'unused'
+        self._executor.shutdown(wait=True)
+
+
+class SpeculativeAgent(Agent):
+    """Agent that answers its first delegation from a speculative result when it is still fresh."""
+
+    _speculation: Optional[JobsToBeDoneSpeculation] = PrivateAttr(default=None)
+
+    def attach_speculation(self, speculation: JobsToBeDoneSpeculation) -> None:
+        """Serve the first delegation from the given speculative run."""
+        self._speculation = speculation
+
+    def execute_task(self, task: Task, context: Optional[str] = None, tools: Optional[list] = None) -> str:
+        if self._speculation is not None:
+            request = f"{task.description}\n{context or ''}"
+            result = self._speculation.take_result(request, timeout=self.max_execution_time)
+            if result is not None:
+                return result
+        return super().execute_task(task, context, tools)
@@ -0,0 +1,63 @@
+"""Token streaming from crew agents to the terminal and a partial output file."""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from crewai import Agent
+from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+
+# The CrewAI event bus is process-wide, so chunks are routed to the run that owns the emitting agent
+_sinks: Dict[str, Callable[[str], None]] = {}
+_sinks_lock = threading.Lock()
+_handler_registered = False
+
+
+def _dispatch_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+    """Forward a streamed chunk to the sink registered for its agent."""
+    sink = _sinks.get(str(event.agent_id))
+    if sink is not None and event.chunk:
+        sink(event.chunk)
+
+
+def _ensure_handler_registered() -> None:
+    """Register the chunk dispatcher on the CrewAI event bus once per process."""
+    global _handler_registered
+    with _sinks_lock:
+        if not _handler_registered:
+            crewai_event_bus.register_handler(LLMStreamChunkEvent, _dispatch_chunk)
+            _handler_registered = True
+
+
+@contextmanager
+def stream_agent_output(agents: List[Agent], partial_path: Path,
+                        on_chunk: Optional[Callable[[str], None]] = None) -> Iterator[None]:
+    """Append the agents' streamed tokens to the partial file while the crew runs.
+
+    CrewAI's console listener already echoes streamed chunks to the terminal; on_chunk
+    receives the same chunks for callers that need them elsewhere.
+    """
+    _ensure_handler_registered()
+    partial_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(partial_path, 'w', encoding='utf-8') as partial_file:
+        lock = threading.Lock()
+
+        def sink(chunk: str) -> None:
+            with lock:
+                partial_file.write(chunk)
+                partial_file.flush()
+                if on_chunk is not None:
+                    on_chunk(chunk)
+
+        agent_ids = [str(agent.id) for agent in agents]
+        with _sinks_lock:
+            for agent_id in agent_ids:
+                _sinks[agent_id] = sink
+        try:
+            yield
+        finally:
+            with _sinks_lock:
+                for agent_id in agent_ids:
+                    _sinks.pop(agent_id, None)
@@ -1,18 +1,29 @@
 """Problem understanding analysis task."""
 
 from pathlib import Path
+from typing import Optional
+
 from crewai import Task
 from .agents import create_product_manager_agent, create_jobs_to_be_done_expert_agent
+from .registry import get_agent
+from .prescreen import PrescreenResult, render_prescreen_instructions
 
 
-def create_problem_understanding_analysis_task(requirements_path: Path, pid_path: Path, overwrite: bool, model: str = 'gpt-4o') -> Task:
-    """Create a task that analyzes problem understanding in the PID."""
-    
-    # Read PID content
+def read_pid_content(pid_path: Path) -> str:
+    """Read the PID content, falling back to an empty document when it cannot be read."""
     try:
-        pid_content = pid_path.read_text(encoding='utf-8')
+        return pid_path.read_text(encoding='utf-8')
     except Exception:
-        pid_content = "# Product Initiative Document\n\n*No existing content found*"
+        return "# Product Initiative Document\n\n*No existing content found*"
+
+
+def create_problem_understanding_analysis_task(requirements_path: Path, pid_path: Path, overwrite: bool, model: str = 'gpt-4o',
+                                               stream: bool = False, prescreen: Optional[PrescreenResult] = None) -> Task:
+    """Create a task that analyzes problem understanding in the PID."""
+    
+    # Read PID content, keeping only sections with real content when it was pre-screened
+    pid_content = prescreen.filtered_content if prescreen else read_pid_content(pid_path)
+    prescreen_instructions = render_prescreen_instructions(prescreen) if prescreen else ''
     
     return Task(
         description=f"""
@@ -22,7 +33,7 @@ def create_problem_understanding_analysis_task(requirements_path: Path, pid_path
         {pid_content}
         
         **Requirements Path:** {requirements_path}
-        
+        {prescreen_instructions}
         **Analysis Framework:**
         Evaluate the problem understanding across these six critical dimensions:
         
@@ -138,11 +149,11 @@ def create_problem_understanding_analysis_task(requirements_path: Path, pid_path
         
         **Note**: This assessment focuses purely on problem understanding quality and does not suggest any solutions.
         """,
-        agent=create_product_manager_agent(model)
+        agent=get_agent(create_product_manager_agent, model, stream=stream)
     )
 
 
-def create_jobs_to_be_done_assessment_task(pid_content: str, model: str = 'gpt-4o') -> Task:
+def create_jobs_to_be_done_assessment_task(pid_content: str, model: str = 'gpt-4o', stream: bool = False) -> Task:
     """Create a task specifically for Jobs-to-be-Done analysis of the PID."""
     
     return Task(
@@ -256,5 +267,5 @@ def create_jobs_to_be_done_assessment_task(pid_content: str, model: str = 'gpt-4
         
         **Note**: This assessment focuses purely on evaluating current JTBD understanding depth.
         """,
-        agent=create_jobs_to_be_done_expert_agent(model)
+        agent=get_agent(create_jobs_to_be_done_expert_agent, model, stream=stream)
     )
\ No newline at end of file
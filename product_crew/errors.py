@@ -0,0 +1,21 @@
+"""Exception types raised by the product crew library API."""
+
+
+class ProductCrewError(Exception):
+    """Base class for all product crew errors."""
+
+
+class InvalidInputError(ProductCrewError, ValueError):
+    """Raised when a requirements path, PID path, model or API key is invalid."""
+
+
+class RefinementError(ProductCrewError):
+    """Raised when the crew fails to produce an assessment."""
+
+
+class RefinementCancelledError(RefinementError):
+    """Raised when a refinement is cancelled before the crew completes."""
+
+
+class OutputWriteError(ProductCrewError):
+    """Raised when the refined PID cannot be written to disk."""
@@ -1,6 +1,6 @@
 """File operations module for product crew."""
 
-from .handlers import load_environment, get_output_file_path, create_pid_file
+from .handlers import load_environment, get_output_file_path, create_pid_file, write_pid_file, get_partial_file_path
 from .templates import (
     generate_pid_template,
     format_agent_contribution,
@@ -13,6 +13,8 @@ __all__ = [
     'load_environment', 
     'get_output_file_path', 
     'create_pid_file',
+    'write_pid_file',
+    'get_partial_file_path',
     'generate_pid_template',
     'format_agent_contribution',
     'combine_agent_outputs', 
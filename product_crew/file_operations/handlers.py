@@ -1,8 +1,10 @@
 """File and environment handling functions."""
 
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import click
 from dotenv import load_dotenv
@@ -35,18 +37,36 @@ def get_output_file_path(original_path: Path, overwrite: bool) -> Path:
     return parent / new_filename
 
 
+def write_pid_file(output_path: Path, content: str, partial_path: Optional[Path] = None) -> None:
+    """Write the PID content, atomically through the partial file when one is given."""
+    # Ensure parent directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    target_path = partial_path if partial_path is not None else output_path
+    with open(target_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        if partial_path is not None:
+            f.flush()
+            os.fsync(f.fileno())
+
+    if partial_path is not None:
+        # Atomic on the same filesystem, so readers never see a half-written PID
+        os.replace(partial_path, output_path)
+
+
 def create_pid_file(output_path: Path, content: str) -> None:
     """Create or overwrite the PID file with the given content."""
     try:
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write content to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-            
+        write_pid_file(output_path, content)
+
         click.echo(f"PID file created: {output_path}")
-        
+
     except (IOError, OSError, PermissionError) as e:
         click.echo(f"Failed to create file {output_path}: {e}", err=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+def get_partial_file_path(output_path: Path) -> Path:
+    """Determine the temporary path that receives streamed content before completion."""
+    return output_path.with_name(f"{output_path.name}.partial")
+
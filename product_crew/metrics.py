@@ -0,0 +1,11 @@
+"""Small statistics helpers shared by latency tracking, comparisons and build reports."""
+
+import math
+from typing import List
+
+
+def percentile(values: List[float], rank_percent: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(rank_percent / 100 * len(ordered)))
+    return ordered[rank - 1]
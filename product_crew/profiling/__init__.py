@@ -0,0 +1,5 @@
+"""Profiling module for the local hot path of refinement runs."""
+
+from .profiler import profile_refinement, collapse_pstats, ProfileReport, SamplingProfiler
+
+__all__ = ['profile_refinement', 'collapse_pstats', 'ProfileReport', 'SamplingProfiler']
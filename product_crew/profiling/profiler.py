@@ -0,0 +1,252 @@
+"""CPU and memory profiling of refinement runs."""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PSTATS_FILENAME = 'refinement.pstats'
+COLLAPSED_FILENAME = 'refinement.collapsed'
+ALLOCATIONS_FILENAME = 'allocations.txt'
+
+# Call paths below this share of the total are dropped when expanding the cProfile call graph
+_MIN_PATH_SHARE = 0.001
+_MAX_STACK_DEPTH = 64
+
+FunctionKey = Tuple[str, int, str]
+
+
+@dataclass
+class ProfileReport:
+    """Output files and summary figures of a profiled refinement."""
+
+    output_dir: Path
+    runs: int
+    wall_time: float
+    peak_memory: int = 0
+    samples: int = 0
+    files: Dict[str, Path] = field(default_factory=dict)
+    top_functions: str = ''
+    top_allocations: List[str] = field(default_factory=list)
+
+
+def _frame_label(filename: str, line: int, name: str) -> str:
+    """Flame graph label for a function; semicolons would split the stack."""
+    if filename == '~':
+        # Built-ins are reported by cProfile as ('~', 0, '<built-in method ...>')
+        return name.replace(';', ',')
+    return f"{name} ({Path(filename).name}:{line})".replace(';', ',')
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler over every thread, recording collapsed stacks."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='product-crew-sampler', daemon=True)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.stacks[self._collapse(frame)] += 1
+            self.samples += 1
+
+    @staticmethod
+    def _collapse(frame: Optional[FrameType]) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            labels.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_qualname))
+            frame = frame.f_back
+        return ';'.join(reversed(labels))
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+# From Python 3.12 cProfile is built on sys.monitoring: one profiler sees every thread and only one can be active
+_PROFILE_COVERS_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class ThreadProfiler:
+    """cProfile over the calling thread and the threads running while it is enabled.
+
+    CrewAI runs agents with an execution timeout in worker threads. From Python 3.12 a
+    single cProfile.Profile already covers them. Before that, a profile is bound to the
+    thread that enabled it, so every thread started while enabled gets its own profiler,
+    whose statistics are taken when profiling stops.
+    """
+
+    def __init__(self):
+        self._main = cProfile.Profile()
+        self._lock = threading.Lock()
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._thread_stats: List[pstats.Stats] = []
+
+    def _bootstrap(self, *args: Any) -> None:
+        # Installed by threading.setprofile and called once in each new thread; swaps itself for a profiler
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def enable(self) -> None:
+        if not _PROFILE_COVERS_ALL_THREADS:
+            threading.setprofile(self._bootstrap)
+        self._main.enable()
+
+    def disable(self) -> None:
+        """Stop profiling, taking the statistics of every thread profiled since enable.
+
+        Before Python 3.12 a thread's profiler can only be removed by that thread, so
+        worker threads that outlive the run stay traced until they exit, but nothing
+        they do afterwards reaches the statistics.
+        """
+        self._main.disable()
+        if _PROFILE_COVERS_ALL_THREADS:
+            return
+        threading.setprofile(None)
+        with self._lock:
+            profiles, self._thread_profiles = self._thread_profiles, []
+            # pstats.Stats takes the profiler's statistics, leaving later samples out
+            self._thread_stats.extend(pstats.Stats(profile) for profile in profiles)
+
+    def stats(self, stream: io.StringIO) -> pstats.Stats:
+        """Merged statistics of every profiled thread."""
+        stats = pstats.Stats(self._main, stream=stream)
+        with self._lock:
+            for thread_stats in self._thread_stats:
+                stats.add(thread_stats)
+        return stats
+
+
+def _call_paths(stats: Dict[FunctionKey, Tuple], function: FunctionKey, weight: float, threshold: float,
+                path: Tuple[FunctionKey, ...] = ()) -> Iterator[Tuple[Tuple[FunctionKey, ...], float]]:
+    """Split a function's own time over its callers' paths, proportionally to the time spent per call edge."""
+    path = (function,) + path
+    callers = {caller: edge for caller, edge in stats[function][4].items()
+               if caller in stats and caller not in path}
+    total = sum(edge[3] for edge in callers.values())
+    if not callers or total <= 0 or len(path) >= _MAX_STACK_DEPTH:
+        yield path, weight
+        return
+    for caller, edge in callers.items():
+        share = weight * edge[3] / total
+        if share >= threshold:
+            yield from _call_paths(stats, caller, share, threshold, path)
+
+
+def collapse_pstats(stats: pstats.Stats) -> Counter:
+    """Approximate collapsed stacks (in microseconds) from a cProfile call graph.
+
+    cProfile keeps only caller-callee edges, so full stacks are reconstructed by
+    attributing each function's own time to its callers in proportion to edge time.
+    Sampling gives exact stacks and is preferred when enabled.
+    """
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    threshold = _MIN_PATH_SHARE * stats.total_tt  # type: ignore[attr-defined]
+    stacks: Counter = Counter()
+    for function, (_, _, own_time, _, _) in raw_stats.items():
+        if own_time <= 0:
+            continue
+        for path, weight in _call_paths(raw_stats, function, own_time, threshold):
+            micros = int(weight * 1_000_000)
+            if micros:
+                stacks[';'.join(_frame_label(*key) for key in path)] += micros
+    return stacks
+
+
+def _write_collapsed(stacks: Counter, path: Path) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def profile_refinement(workload: Callable[[], Any], output_dir: Path, runs: int = 1, top: int = 25,
+                       sample_interval: Optional[float] = None, trace_memory: bool = True,
+                       memory_frames: int = 10, warmup: int = 0) -> ProfileReport:
+    """Run a refinement workload under cProfile and tracemalloc and write the profile files.
+
+    Writes the raw pstats, a collapsed-stack file for flame graph tools (from the sampler
+    when sample_interval is set, otherwise reconstructed from cProfile) and the top
+    allocation sites by size. Warmup runs are not profiled, which keeps lazy imports
+    and first-use caches out of the report.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for _ in range(warmup):
+        workload()
+
+    sampler = SamplingProfiler(sample_interval) if sample_interval else None
+    profiler = ThreadProfiler()
+
+    if trace_memory:
+        tracemalloc.start(memory_frames)
+    if sampler:
+        sampler.start()
+    started = time.perf_counter()
+    try:
+        for _ in range(runs):
+            profiler.enable()
+            try:
+                workload()
+            finally:
+                profiler.disable()
+    finally:
+        wall_time = time.perf_counter() - started
+        if sampler:
+            sampler.stop()
+        snapshot = tracemalloc.take_snapshot() if trace_memory else None
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+        if trace_memory:
+            tracemalloc.stop()
+
+    report = ProfileReport(output_dir=output_dir, runs=runs, wall_time=wall_time, peak_memory=peak_memory,
+                           samples=sampler.samples if sampler else 0)
+
+    text = io.StringIO()
+    stats = profiler.stats(text)
+    report.files['pstats'] = output_dir / PSTATS_FILENAME
+    stats.dump_stats(report.files['pstats'])
+
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    report.top_functions = text.getvalue()
+
+    report.files['collapsed'] = output_dir / COLLAPSED_FILENAME
+    _write_collapsed(sampler.stacks if sampler else collapse_pstats(stats), report.files['collapsed'])
+
+    if snapshot is not None:
+        # Drop the profiler's own bookkeeping so it does not dominate the report
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        report.top_allocations = [str(entry) for entry in snapshot.statistics('lineno')[:top]]
+        report.files['allocations'] = output_dir / ALLOCATIONS_FILENAME
+        with open(report.files['allocations'], 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {peak_memory / 1024:.1f} KiB\n\n")
+            for number, entry in enumerate(snapshot.statistics('traceback')[:top], start=1):
+                f.write(f"#{number}: {entry.size / 1024:.1f} KiB in {entry.count} blocks\n")
+                for line in entry.traceback.format():
+                    f.write(f"{line}\n")
+                f.write("\n")
+
+    return report
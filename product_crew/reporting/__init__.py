@@ -0,0 +1,5 @@
+"""Reporting module for portfolio summaries of refinement outputs."""
+
+from .portfolio import write_portfolio_report, iter_portfolio, PortfolioEntry, PortfolioSummary
+
+__all__ = ['write_portfolio_report', 'iter_portfolio', 'PortfolioEntry', 'PortfolioSummary']
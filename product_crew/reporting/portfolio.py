@@ -0,0 +1,228 @@
+"""Portfolio report over refinement outputs, written with memory bounded by a single PID."""
+
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from ..build.builder import GENERATED_OUTPUT_PATTERN, REQUIREMENTS_DIRNAME
+from ..crew.assessment import DIMENSIONS, STATUS_SCORES, Assessment, parse_assessment
+
+# Distinct priority gaps tracked exactly; beyond it, counts become lower bounds
+GAP_COUNTER_CAPACITY = 1000
+
+_GAP_LABEL_PATTERN = re.compile(r'^\*\*(.+?)\*\*')
+_MAX_GAP_LABEL_LENGTH = 80
+
+
+@dataclass
+class PortfolioEntry:
+    """Assessment of one PID, taken from its latest refinement output."""
+
+    name: str
+    output_path: Path
+    assessment: Assessment
+
+
+class _BoundedCounter:
+    """Frequency counter holding at most capacity keys (Misra-Gries).
+
+    While the number of distinct keys stays under capacity the counts are exact, so
+    memory stays flat however many PIDs are reported.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.exact = True
+
+    def add(self, key: str) -> None:
+        if key in self.counts or len(self.counts) < self.capacity:
+            self.counts[key] = self.counts.get(key, 0) + 1
+            return
+        self.exact = False
+        for existing in list(self.counts):
+            self.counts[existing] -= 1
+            if not self.counts[existing]:
+                del self.counts[existing]
+
+    def most_common(self, limit: int) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+@dataclass
+class PortfolioSummary:
+    """Running aggregates over every PID in the portfolio."""
+
+    pids: int = 0
+    readiness: Dict[str, int] = field(default_factory=lambda: {'Ready': 0, 'Not Ready': 0, 'Unknown': 0})
+    score_total: float = 0.0
+    scored_pids: int = 0
+    statuses: Dict[str, Dict[str, int]] = field(
+        default_factory=lambda: {dimension: {} for dimension in DIMENSIONS}
+    )
+    dimension_score_totals: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(DIMENSIONS, 0.0))
+    dimension_score_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(DIMENSIONS, 0))
+    gaps: _BoundedCounter = field(default_factory=lambda: _BoundedCounter(GAP_COUNTER_CAPACITY))
+
+    def add(self, assessment: Assessment) -> None:
+        self.pids += 1
+        self.readiness[assessment.readiness or 'Unknown'] += 1
+        if assessment.overall_score is not None:
+            self.score_total += assessment.overall_score
+            self.scored_pids += 1
+        for dimension, score in assessment.dimension_scores.items():
+            status = assessment.statuses.get(dimension) or 'Missing'
+            self.statuses[dimension][status] = self.statuses[dimension].get(status, 0) + 1
+            if score is not None:
+                self.dimension_score_totals[dimension] += score
+                self.dimension_score_counts[dimension] += 1
+        for gap in assessment.priority_gaps:
+            self.gaps.add(gap_label(gap))
+
+    @property
+    def average_score(self) -> Optional[float]:
+        return self.score_total / self.scored_pids if self.scored_pids else None
+
+
+def gap_label(gap: str) -> str:
+    """Short label grouping a priority gap across PIDs, e.g. '**Value**: missing' -> 'Value'."""
+    match = _GAP_LABEL_PATTERN.match(gap)
+    label = match.group(1) if match else gap
+    return label.strip().rstrip(':')[:_MAX_GAP_LABEL_LENGTH]
+
+
+def _output_candidates(directory: Path) -> Iterator[Tuple[str, List[Path]]]:
+    """Group a directory's markdown files by PID, latest dated output first, then the undated file."""
+    groups: Dict[str, List[Path]] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.md'):
+                stem = entry.name[:-3]
+                groups.setdefault(GENERATED_OUTPUT_PATTERN.sub('', stem), []).append(Path(entry.path))
+    for name in sorted(groups):
+        # Dated outputs sort by date; the undated PID (possibly refined with --overwrite) comes last
+        yield name, sorted(groups[name], key=lambda path: (GENERATED_OUTPUT_PATTERN.search(path.stem) is not None,
+                                                           path.stem), reverse=True)
+
+
+def _walk_directories(root: Path) -> Iterator[Path]:
+    """Yield root and its subdirectories depth first in sorted order, skipping requirements and hidden folders.
+
+    Symlinked directories are not followed, so a link back up the tree cannot loop.
+    """
+    yield root
+    # The listing is closed before recursing, so only one directory handle is open at a time
+    with os.scandir(root) as entries:
+        subdirectories = sorted(entry.name for entry in entries
+                                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')
+                                and entry.name != REQUIREMENTS_DIRNAME)
+    for name in subdirectories:
+        yield from _walk_directories(root / name)
+
+
+def iter_portfolio(root: Path, exclude: Optional[Path] = None) -> Iterator[PortfolioEntry]:
+    """Yield the latest assessment of each PID under root, holding one directory listing and one output at a time."""
+    for directory in _walk_directories(root):
+        for name, candidates in _output_candidates(directory):
+            for path in candidates:
+                if exclude is not None and path.resolve() == exclude:
+                    continue
+                try:
+                    content = path.read_text(encoding='utf-8')
+                except (OSError, UnicodeDecodeError):
+                    continue
+                assessment = parse_assessment(content)
+                if assessment.overall_score is None and not any(assessment.statuses.values()):
+                    continue
+                yield PortfolioEntry(str((directory / name).relative_to(root)), path, assessment)
+                break
+
+
+def _format_number(value: Optional[float], digits: int = 1) -> str:
+    return f"{value:.{digits}f}" if value is not None else 'n/a'
+
+
+def _write_index_row(out: TextIO, entry: PortfolioEntry) -> None:
+    assessment = entry.assessment
+    well_defined = sum(1 for status in assessment.statuses.values() if status == 'Well Defined')
+    anchor = re.sub(r'[^a-z0-9 _-]', '', entry.name.lower()).replace(' ', '-')
+    out.write(f"| [{entry.name}](#{anchor}) | {_format_number(assessment.overall_score)} | "
+              f"{assessment.readiness or 'Unknown'} | {well_defined}/{len(DIMENSIONS)} |\n")
+
+
+def _write_section(out: TextIO, entry: PortfolioEntry, root: Path) -> None:
+    assessment = entry.assessment
+    out.write(f"\n### {entry.name}\n\n")
+    out.write(f"- **Output**: `{entry.output_path.relative_to(root)}`\n")
+    out.write(f"- **Problem Understanding Score**: {_format_number(assessment.overall_score)}/10\n")
+    out.write(f"- **Readiness**: {assessment.readiness or 'Unknown'}\n\n")
+    out.write("| Dimension | Status |\n|---|---|\n")
+    for dimension in DIMENSIONS:
+        out.write(f"| {dimension} | {assessment.statuses.get(dimension) or 'Missing'} |\n")
+    if assessment.priority_gaps:
+        out.write("\n**Priority Gaps**:\n")
+        for number, gap in enumerate(assessment.priority_gaps, start=1):
+            out.write(f"{number}. {gap}\n")
+
+
+def _write_aggregates(out: TextIO, summary: PortfolioSummary, root: Path, top_gaps: int) -> None:
+    out.write("# PID Portfolio Report\n\n")
+    out.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Root: `{root}` | PIDs: {summary.pids}*\n\n")
+
+    out.write("## Summary\n\n| Metric | Value |\n|---|---|\n")
+    out.write(f"| PIDs assessed | {summary.pids} |\n")
+    out.write(f"| Average Problem Understanding Score | {_format_number(summary.average_score)}/10 |\n")
+    for readiness, count in summary.readiness.items():
+        out.write(f"| {readiness} for solution development | {count} |\n")
+
+    statuses = [*STATUS_SCORES, 'Missing']
+    out.write("\n## Dimension Coverage\n\n")
+    out.write(f"| Dimension | {' | '.join(statuses)} | Average Score |\n")
+    out.write(f"|---|{'---|' * len(statuses)}---|\n")
+    for dimension in DIMENSIONS:
+        counts = ' | '.join(str(summary.statuses[dimension].get(status, 0)) for status in statuses)
+        scored = summary.dimension_score_counts[dimension]
+        average = summary.dimension_score_totals[dimension] / scored if scored else None
+        out.write(f"| {dimension} | {counts} | {_format_number(average, 2)} |\n")
+
+    out.write("\n## Most Common Priority Gaps\n\n")
+    if not summary.gaps.exact:
+        out.write(f"*More than {summary.gaps.capacity} distinct gaps; counts are lower bounds.*\n\n")
+    out.write("| Gap | PIDs |\n|---|---|\n")
+    for label, count in summary.gaps.most_common(top_gaps):
+        out.write(f"| {label.replace('|', '/')} | {count} |\n")
+
+
+def write_portfolio_report(root: Path, output_path: Path, top_gaps: int = 10) -> PortfolioSummary:
+    """Write a portfolio report over every refined PID under root and return its aggregates.
+
+    PID rows and sections are streamed to temporary files while the aggregates accumulate,
+    then copied after the aggregate tables, so memory does not grow with the number of PIDs.
+    """
+    summary = PortfolioSummary()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f"{output_path.name}.tmp")
+
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as index, \
+            tempfile.TemporaryFile('w+', encoding='utf-8') as sections:
+        for entry in iter_portfolio(root, exclude=output_path.resolve()):
+            summary.add(entry.assessment)
+            _write_index_row(index, entry)
+            _write_section(sections, entry, root)
+
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            _write_aggregates(out, summary, root, top_gaps)
+            out.write("\n## PIDs\n\n| PID | Score | Readiness | Well Defined |\n|---|---|---|---|\n")
+            index.seek(0)
+            shutil.copyfileobj(index, out)
+            out.write("\n## PID Details\n")
+            sections.seek(0)
+            shutil.copyfileobj(sections, out)
+    os.replace(temp_path, output_path)
+
+    return summary
@@ -0,0 +1,57 @@
+"""Tests for the model comparison harness and the compare command."""
+
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from product_crew.cli.main import cli
+from product_crew.comparison import harness
+from product_crew.crew.assessment import parse_assessment
+from product_crew.errors import RefinementError
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'requirements').mkdir()
+    pid_path = tmp_path / 'initiative.md'
+    pid_path.write_text("# Initiative\n\n## Users\n\nSmall retailers.\n", encoding='utf-8')
+    return tmp_path / 'requirements', pid_path
+
+
+@pytest.fixture
+def refinements(monkeypatch):
+    """Replace the crew, failing every run of models named 'failing-*' and recording the options used."""
+    calls = []
+
+    async def refine_pid(requirements_path, pid_path, model, **options):
+        calls.append(options)
+        if model.startswith('failing-'):
+            raise RefinementError(f"{model} failed")
+        return SimpleNamespace(timings={'total': 1.0}, token_usage={'prompt_tokens': 10, 'completion_tokens': 5},
+                               assessment=parse_assessment(''))
+
+    monkeypatch.setattr(harness, 'refine_pid', refine_pid)
+    return calls
+
+
+def test_compare_models_runs_with_fixed_limits(corpus, refinements):
+    requirements_path, pid_path = corpus
+
+    report = harness.compare_models(requirements_path, [pid_path], ['gpt-4o', 'failing-model'], runs=2)
+
+    assert all(options['adaptive_limits'] is False for options in refinements)
+    assert [(summary.model, summary.runs, summary.failures) for summary in report.summaries] == [
+        ('gpt-4o', 2, 0), ('failing-model', 2, 2)]
+
+
+@pytest.mark.parametrize('models, exit_code', [(['gpt-4o'], 0), (['gpt-4o', 'failing-model'], 1)])
+def test_compare_exits_non_zero_when_runs_failed(corpus, refinements, models, exit_code):
+    requirements_path, pid_path = corpus
+    model_options = [option for model in models for option in ('-m', model)]
+
+    result = CliRunner().invoke(cli, ['compare', str(pid_path), '-r', str(requirements_path), *model_options])
+
+    assert result.exit_code == exit_code, result.output
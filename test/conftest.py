@@ -0,0 +1,60 @@
+"""Shared fixtures for tests that run real crews without reaching a model."""
+
+import os
+
+# Read by CrewAI when it is imported, so test crews send no telemetry
+os.environ.setdefault('CREWAI_DISABLE_TELEMETRY', 'true')
+os.environ.setdefault('OTEL_SDK_DISABLED', 'true')
+
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+import pytest
+from crewai.llms.base_llm import BaseLLM
+
+from product_crew.crew import agents
+from product_crew.crew.registry import clear_agent_registry
+
+FINAL_ANSWER = "Thought: I can assess the PID now.\nFinal Answer: **Problem Understanding Score**: 6/10\n"
+
+
+class StubLLM(BaseLLM):
+    """LLM answering every call with respond(messages), recording the messages it was sent.
+
+    Each call reports PROMPT_TOKENS and COMPLETION_TOKENS to CrewAI's token counters, as litellm does.
+    """
+
+    PROMPT_TOKENS = 100
+    COMPLETION_TOKENS = 20
+
+    def __init__(self):
+        super().__init__(model='gpt-4o')
+        self.calls: List[Any] = []
+        self.respond: Callable[[Any], str] = lambda messages: FINAL_ANSWER
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None,
+             from_agent=None) -> str:
+        self.calls.append(messages)
+        usage = SimpleNamespace(prompt_tokens=self.PROMPT_TOKENS, completion_tokens=self.COMPLETION_TOKENS,
+                                prompt_tokens_details=None)
+        for callback in callbacks or []:
+            if hasattr(callback, 'log_success_event'):
+                callback.log_success_event({}, {'usage': usage}, 0.0, 0.0)
+        return self.respond(messages)
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Build every agent on one StubLLM, with a registry that holds no agents built on real LLMs."""
+    llm = StubLLM()
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    # The agent factories set these, so they are restored afterwards
+    monkeypatch.delenv('MODEL', raising=False)
+    monkeypatch.delenv('OPENAI_MODEL_NAME', raising=False)
+    monkeypatch.setattr(agents, '_create_llm', lambda model, stream=False: llm)
+    clear_agent_registry()
+    yield llm
+    clear_agent_registry()
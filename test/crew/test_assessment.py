@@ -0,0 +1,69 @@
+"""Tests for parsing Problem Understanding Assessments."""
+
+from product_crew.crew.assessment import DIMENSIONS, parse_assessment
+
+ASSESSMENT = """# Problem Understanding Assessment
+
+**Problem Understanding Score**: [6.5/10]
+**Readiness for Solution Development**: Not Ready
+
+## Dimension Analysis
+
+### 1. User and Customer Identification
+**Status**: Well Defined
+
+### 2. Job-to-be-Done Understanding
+**Status**: [partially defined]
+
+### 3. Value Proposition Clarity
+**Status**: Not Defined
+
+### 4. Competitive Landscape Analysis
+No status given.
+
+### 7. Not a dimension
+**Status**: Well Defined
+
+## Priority Gaps
+
+1. **Value**: no quantified benefit
+2. **Competition**: alternatives not listed
+
+## Recommendations
+
+1. Interview customers
+"""
+
+
+def test_scores_statuses_and_gaps_are_parsed():
+    assessment = parse_assessment(ASSESSMENT)
+
+    assert assessment.overall_score == 6.5
+    assert assessment.readiness == 'Not Ready'
+    assert assessment.statuses == {
+        'User and Customer Identification': 'Well Defined',
+        'Job-to-be-Done Understanding': 'Partially Defined',
+        'Value Proposition Clarity': 'Not Defined',
+        'Competitive Landscape Analysis': None,
+        'Success Metrics Definition': None,
+        'Service Blueprint Context': None,
+    }
+    assert assessment.priority_gaps == ['**Value**: no quantified benefit', '**Competition**: alternatives not listed']
+
+
+def test_dimension_scores_follow_statuses():
+    scores = parse_assessment(ASSESSMENT).dimension_scores
+
+    assert scores['User and Customer Identification'] == 1.0
+    assert scores['Job-to-be-Done Understanding'] == 0.5
+    assert scores['Value Proposition Clarity'] == 0.0
+    assert scores['Competitive Landscape Analysis'] is None
+
+
+def test_text_without_an_assessment_parses_to_nothing():
+    assessment = parse_assessment("# Initiative\n\nJust a PID.\n")
+
+    assert assessment.overall_score is None
+    assert assessment.readiness is None
+    assert assessment.statuses == dict.fromkeys(DIMENSIONS)
+    assert assessment.priority_gaps == []
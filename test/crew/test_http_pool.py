@@ -0,0 +1,96 @@
+"""Tests for the shared keep-alive HTTP client pool, against a local stub of the OpenAI API."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import litellm
+import pytest
+
+from product_crew.crew.http_pool import close_http_pool, get_llm_client, http_pool_stats
+
+
+class _StubCompletionsHandler(BaseHTTPRequestHandler):
+    """Answers chat completions with keep-alive HTTP/1.1, streamed as chunked server-sent events on request."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if body.get('stream'):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            chunk = {'id': 'stub', 'object': 'chat.completion.chunk', 'created': 1, 'model': body['model'],
+                     'choices': [{'index': 0, 'delta': {'content': 'Hello'}, 'finish_reason': 'stop'}]}
+            for event in (f"data: {json.dumps(chunk)}\n\n", 'data: [DONE]\n\n'):
+                data = event.encode()
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+            self.wfile.flush()
+            # The chunked terminator arrives after the client has stopped reading at [DONE]
+            time.sleep(0.05)
+            self.wfile.write(b'0\r\n\r\n')
+            return
+
+        payload = json.dumps({
+            'id': 'stub', 'object': 'chat.completion', 'created': 1, 'model': body['model'],
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'Hello'}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': 10, 'completion_tokens': 1, 'total_tokens': 11},
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubCompletionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('OPENAI_BASE_URL', f"http://127.0.0.1:{server.server_port}/v1")
+    close_http_pool()
+    yield server
+    close_http_pool()
+    server.shutdown()
+    server.server_close()
+
+
+def _complete(stream: bool = False) -> str:
+    response = litellm.completion(model='gpt-4o', messages=[{'role': 'user', 'content': 'Hi'}],
+                                  client=get_llm_client('gpt-4o'), stream=stream)
+    if stream:
+        return ''.join(chunk.choices[0].delta.content or '' for chunk in response)
+    return response.choices[0].message.content
+
+
+def test_requests_reuse_one_connection(stub_server):
+    assert [_complete() for _ in range(3)] == ['Hello'] * 3
+
+    assert http_pool_stats()['openai'] == {'requests': 3, 'connections_opened': 1, 'reused': 2, 'http2_requests': 0}
+
+
+def test_streamed_responses_keep_their_connection(stub_server):
+    assert _complete(stream=True) == 'Hello'
+    assert _complete(stream=True) == 'Hello'
+    assert _complete() == 'Hello'
+
+    stats = http_pool_stats()['openai']
+    assert stats['requests'] == 3
+    assert stats['connections_opened'] == 1
+
+
+def test_close_http_pool_forgets_clients_and_statistics(stub_server):
+    first = get_llm_client('gpt-4o')
+    _complete()
+    close_http_pool()
+
+    assert http_pool_stats() == {}
+    assert get_llm_client('gpt-4o') is not first
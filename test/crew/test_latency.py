@@ -0,0 +1,148 @@
+"""Tests for latency history and the agent limits derived from it."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from product_crew.crew import latency, runner
+from product_crew.crew.latency import (
+    EXECUTION_TIMEOUT, LLM_CALL_TIMEOUT, MIN_SAMPLES, AgentLimits, LatencyHistory, record_agent_latency
+)
+from product_crew.crew.runner import execute_refinement
+
+ROLE = 'Product Manager'
+MODEL = 'gpt-4o'
+DEFAULTS = AgentLimits(max_iter=25, max_execution_time=600)
+
+
+@pytest.fixture
+def history(tmp_path):
+    return LatencyHistory(tmp_path / 'latency.json')
+
+
+def _record_healthy_runs(history, count=MIN_SAMPLES, duration=10.0, iterations=3):
+    for _ in range(count):
+        history.record(ROLE, MODEL, duration, iterations, input_chars=1000)
+
+
+def test_defaults_until_enough_samples(history):
+    _record_healthy_runs(history, MIN_SAMPLES - 1)
+
+    assert history.derive_limits(ROLE, MODEL, 1000, DEFAULTS) is DEFAULTS
+
+
+def test_limits_follow_observed_latency(history):
+    _record_healthy_runs(history)
+
+    limits = history.derive_limits(ROLE, MODEL, 1000, DEFAULTS)
+
+    assert limits.max_execution_time == latency.MIN_EXECUTION_TIME
+    assert limits.max_iter == 4
+    assert limits.llm_timeout == latency.MIN_LLM_TIMEOUT
+
+
+def test_larger_input_gets_more_time(history):
+    _record_healthy_runs(history, duration=40.0)
+
+    assert history.derive_limits(ROLE, MODEL, 4000, DEFAULTS).max_execution_time == 320
+
+
+def test_history_is_persisted(history):
+    _record_healthy_runs(history)
+
+    assert len(LatencyHistory(history.path).samples(ROLE, MODEL)) == MIN_SAMPLES
+
+
+def test_execution_timeout_loosens_the_limit(history):
+    _record_healthy_runs(history)
+    history.record(ROLE, MODEL, 30.5, 2, 1000, timed_out=EXECUTION_TIMEOUT, limit=30)
+
+    assert history.derive_limits(ROLE, MODEL, 1000, DEFAULTS).max_execution_time >= 60
+
+
+def test_llm_call_timeout_loosens_the_call_limit(history):
+    _record_healthy_runs(history)
+    history.record(ROLE, MODEL, 16.0, 1, 1000, timed_out=LLM_CALL_TIMEOUT, limit=15.0)
+
+    limits = history.derive_limits(ROLE, MODEL, 1000, DEFAULTS)
+
+    assert limits.llm_timeout >= 30.0
+
+
+def _event(agent, error=None):
+    return SimpleNamespace(agent=agent, error=error)
+
+
+def _agent():
+    return SimpleNamespace(id='agent-1', role=ROLE, max_execution_time=30,
+                           llm=SimpleNamespace(timeout=15.0), agent_executor=SimpleNamespace(iterations=2))
+
+
+@pytest.mark.parametrize('error, kind', [
+    ("Task 'Analyze' execution timed out after 30 seconds. Consider increasing max_execution_time", EXECUTION_TIMEOUT),
+    ('litellm.Timeout: Request timed out', LLM_CALL_TIMEOUT),
+])
+def test_timed_out_run_is_recorded_at_its_limit(history, monkeypatch, error, kind):
+    monkeypatch.setattr(latency, '_ensure_handlers_registered', lambda: None)
+    agent = _agent()
+
+    with record_agent_latency([agent], history, MODEL, 1000):
+        latency._on_started(None, _event(agent))
+        latency._on_error(None, _event(agent, error))
+
+    [sample] = history.samples(ROLE, MODEL)
+    assert sample['timed_out'] == kind
+    assert sample['limit'] == (30 if kind == EXECUTION_TIMEOUT else 15.0)
+    assert sample['iterations'] == 2
+
+
+def test_failures_that_are_not_timeouts_are_not_recorded(history, monkeypatch):
+    monkeypatch.setattr(latency, '_ensure_handlers_registered', lambda: None)
+    agent = _agent()
+
+    with record_agent_latency([agent], history, MODEL, 1000):
+        latency._on_started(None, _event(agent))
+        latency._on_error(None, _event(agent, 'litellm.AuthenticationError: invalid key'))
+
+    assert history.samples(ROLE, MODEL) == []
+
+
+@pytest.fixture
+def crew_run(tmp_path, history, monkeypatch):
+    """Refine a small PID with a real crew, recording into the test history."""
+    monkeypatch.setattr(runner, 'get_latency_history', lambda: history)
+    (tmp_path / 'requirements').mkdir()
+    pid_path = tmp_path / 'initiative.md'
+    pid_path.write_text("# Initiative\n\n## Users\n\nSmall retailers.\n", encoding='utf-8')
+
+    def run(cancel_event=None):
+        return execute_refinement(tmp_path / 'requirements', pid_path, overwrite=False, write_output=False,
+                                  prescreen=False, cancel_event=cancel_event)
+
+    return run
+
+
+def test_completed_crew_run_is_recorded(stub_llm, history, crew_run):
+    crew_run()
+
+    [sample] = history.samples(ROLE, MODEL)
+    assert sample['iterations'] == 1
+    assert 'timed_out' not in sample
+
+
+def test_cancelled_crew_run_is_not_recorded_as_a_timeout(stub_llm, history, crew_run):
+    cancel_event = threading.Event()
+    answer = stub_llm.respond
+
+    def respond(messages):
+        # Cancelled while the model answers, so the crew stops at the step callback that follows
+        cancel_event.set()
+        return answer(messages)
+
+    stub_llm.respond = respond
+
+    with pytest.raises(TimeoutError):
+        crew_run(cancel_event)
+
+    assert history.samples(ROLE, MODEL) == []
@@ -0,0 +1,99 @@
+"""Tests for local pre-screening of PIDs."""
+
+from pathlib import Path
+
+from product_crew.crew.assessment import DIMENSIONS
+from product_crew.crew.prescreen import parse_sections, prescreen_pid, render_prescreen_instructions
+from product_crew.file_operations.templates import generate_pid_template
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+NESTED_PID = """# Checkout redesign
+
+## Problem Space
+
+### Who we serve
+
+First-time buyers on mobile who abandon checkout at the payment step.
+
+### What they try to get done
+
+Pay for a basket in under a minute without creating an account.
+
+## Solution Space
+
+### Strategic Goal & Success Metrics
+
+💡 What is the strategic fit and why is it important to our users and our
+business to solve this problem?
+
+### User Flows
+
+Describe the user flows you're taking to solve the problem.
+"""
+
+
+def test_template_pid_skips_the_model():
+    result = prescreen_pid((REPO_ROOT / 'template' / 'pid.md').read_text(encoding='utf-8'))
+
+    assert result.sections_with_content == 0
+    assert result.undefined_dimensions == list(DIMENSIONS)
+    assert result.skip_llm
+
+
+def test_generated_template_skips_the_model():
+    result = prescreen_pid(generate_pid_template('Checkout redesign'))
+
+    assert result.skip_llm
+
+
+def test_filled_pid_has_no_undefined_dimensions():
+    content = (REPO_ROOT / 'test' / 'pid.md').read_text(encoding='utf-8')
+    result = prescreen_pid(content)
+
+    assert result.undefined_dimensions == []
+    assert not result.skip_llm
+    assert 'nestleaver' in result.filtered_content
+
+
+def test_parent_heading_counts_subsection_content():
+    sections = {section.title: section for section in parse_sections(NESTED_PID)}
+
+    assert sections['Problem Space'].has_content
+    assert sections['Who we serve'].has_content
+    assert not sections['Solution Space'].has_content
+    assert not sections['User Flows'].has_content
+
+
+def test_nested_problem_space_is_not_flagged():
+    result = prescreen_pid(NESTED_PID)
+
+    assert result.undefined_dimensions == []
+    assert '## Problem Space\n\n### Who we serve' in result.filtered_content
+    assert 'Describe the user flows' not in result.filtered_content
+
+
+def test_placeholder_section_is_flagged_once():
+    content = """# Initiative
+
+## Users
+
+Small retailers running a single shop.
+
+## Success Metrics
+
+[Key performance indicators and success criteria]
+"""
+    result = prescreen_pid(content)
+
+    assert result.undefined_dimensions == ['Success Metrics Definition']
+    assert 'Key performance indicators' not in result.filtered_content
+
+
+def test_instructions_are_hints():
+    result = prescreen_pid("## Users\n\nSmall retailers.\n\n## Competition\n\n[Head-to-head analysis]\n")
+    instructions = render_prescreen_instructions(result)
+
+    assert 'Competitive Landscape Analysis' in instructions
+    assert 'Not Defined' not in instructions
+    assert render_prescreen_instructions(prescreen_pid("## Users\n\nSmall retailers.\n")) == ''
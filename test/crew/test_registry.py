@@ -0,0 +1,49 @@
+"""Tests for reusing agent definitions across runs."""
+
+import pytest
+from crewai import Agent
+
+from product_crew.crew.registry import clear_agent_registry, get_agent
+
+built = []
+
+
+def create_test_agent(model: str, stream: bool = False) -> Agent:
+    built.append((model, stream))
+    return Agent(role='Tester', goal='Check PIDs', backstory='Reviews documents', llm=model, verbose=False)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    built.clear()
+    clear_agent_registry()
+    yield
+    clear_agent_registry()
+
+
+def test_definitions_are_built_once_per_model_and_config():
+    get_agent(create_test_agent, 'gpt-4o')
+    get_agent(create_test_agent, 'gpt-4o')
+    get_agent(create_test_agent, 'gpt-4o', stream=True)
+    get_agent(create_test_agent, 'gpt-4o-mini')
+
+    assert built == [('gpt-4o', False), ('gpt-4o', True), ('gpt-4o-mini', False)]
+
+
+def test_copies_do_not_share_execution_state():
+    first = get_agent(create_test_agent, 'gpt-4o')
+    second = get_agent(create_test_agent, 'gpt-4o')
+
+    assert first is not second and first.id != second.id
+    first.tools.append(object())
+    first.tools_results.append({'result': 'done'})
+    first._token_process.sum_prompt_tokens(100)
+    first._times_executed += 1
+
+    assert second.tools == [] and second.tools_results == []
+    assert second._token_process.get_summary().prompt_tokens == 0
+    assert second._times_executed == 0
+    assert first.tools_handler is not second.tools_handler
+    # The shared definition is unchanged for later runs
+    assert get_agent(create_test_agent, 'gpt-4o').tools == []
@@ -0,0 +1,62 @@
+"""Tests for refinement execution that do not reach a model."""
+
+import threading
+
+import pytest
+
+from product_crew.crew.runner import CrewCancelledError, execute_refinement
+
+TEMPLATE_PID = "# Initiative\n\n## Problem Space\n\n[Clear definition of the problem]\n"
+
+
+@pytest.fixture
+def template_pid(tmp_path):
+    (tmp_path / 'requirements').mkdir()
+    pid_path = tmp_path / 'initiative.md'
+    pid_path.write_text(TEMPLATE_PID, encoding='utf-8')
+    return tmp_path / 'requirements', pid_path
+
+
+def test_unfilled_template_is_assessed_locally(template_pid):
+    requirements_path, pid_path = template_pid
+
+    result = execute_refinement(requirements_path, pid_path, overwrite=False, adaptive_limits=False)
+
+    assert result.token_usage == {}
+    assert result.prescreen['llm_skipped']
+    assert set(result.assessment.statuses.values()) == {'Not Defined'}
+    assert result.output_path.read_text(encoding='utf-8') == result.content
+
+
+def test_cancelled_run_writes_no_output(template_pid):
+    requirements_path, pid_path = template_pid
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(CrewCancelledError):
+        execute_refinement(requirements_path, pid_path, overwrite=False, cancel_event=cancel_event,
+                           adaptive_limits=False)
+
+    assert sorted(path.name for path in pid_path.parent.glob('*.md')) == ['initiative.md']
+
+
+def test_cancellation_during_kickoff_raises_crew_cancelled(tmp_path, stub_llm):
+    (tmp_path / 'requirements').mkdir()
+    pid_path = tmp_path / 'initiative.md'
+    pid_path.write_text("# Initiative\n\n## Users\n\nSmall retailers.\n", encoding='utf-8')
+    cancel_event = threading.Event()
+    answer = stub_llm.respond
+
+    def respond(messages):
+        cancel_event.set()
+        return answer(messages)
+
+    stub_llm.respond = respond
+
+    with pytest.raises(CrewCancelledError) as error:
+        execute_refinement(tmp_path / 'requirements', pid_path, overwrite=False, cancel_event=cancel_event,
+                           prescreen=False, adaptive_limits=False)
+
+    # CrewAI reports the cancellation as an execution timeout of the agent
+    assert 'execution timed out' in str(error.value.__cause__)
+    assert sorted(path.name for path in tmp_path.glob('*.md')) == ['initiative.md']
@@ -0,0 +1,96 @@
+"""Tests for serving delegations from a speculative Jobs-to-be-Done run."""
+
+import pytest
+from crewai.tools.agent_tools.delegate_work_tool import DelegateWorkTool
+
+from product_crew.crew.agents import create_jobs_to_be_done_expert_agent
+from product_crew.crew.registry import get_agent
+from product_crew.crew.runner import CrewCancelledError
+from product_crew.crew.speculation import JobsToBeDoneSpeculation, SpeculativeAgent, matches_speculated_task
+
+PID_CONTENT = "# Initiative\n\n## Users\n\nSmall retailers.\n"
+JTBD_REQUEST = "Assess the Jobs-to-be-Done understanding of this PID"
+
+
+def _final_answer(text):
+    return f"Thought: I have assessed it.\nFinal Answer: {text}"
+
+
+def _speculation(pid_path, step_callback=lambda step: None):
+    return JobsToBeDoneSpeculation.start(pid_path, PID_CONTENT, 'gpt-4o', False, step_callback)
+
+
+@pytest.fixture
+def pid_path(tmp_path):
+    path = tmp_path / 'initiative.md'
+    path.write_text(PID_CONTENT, encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('request_text, expected', [
+    (JTBD_REQUEST, True),
+    ('Analyze the JTBD of the target users', True),
+    ('Review the jobs to be done in the PID', True),
+    ('Assess the competitive landscape of this PID', False),
+    ('What does the term job mean here?', False),
+])
+def test_matches_speculated_task(request_text, expected):
+    assert matches_speculated_task(request_text) is expected
+
+
+def test_first_matching_delegation_is_served(pid_path, stub_llm):
+    stub_llm.respond = lambda messages: _final_answer('JTBD RESULT')
+    speculation = _speculation(pid_path)
+
+    assert speculation.take_result('Assess the competitive landscape') is None
+    assert speculation.take_result(JTBD_REQUEST) == 'JTBD RESULT'
+    assert speculation.status == 'used'
+    # Follow-up delegations run live
+    assert speculation.take_result(JTBD_REQUEST) is None
+
+
+def test_changed_pid_is_delegated_live(pid_path, stub_llm):
+    speculation = _speculation(pid_path)
+    pid_path.write_text(PID_CONTENT + "\nMore content.\n", encoding='utf-8')
+
+    assert speculation.take_result(JTBD_REQUEST) is None
+    assert speculation.status == 'stale'
+    speculation.shutdown()
+
+
+def test_failed_run_is_delegated_live(pid_path, stub_llm):
+    def fail(messages):
+        raise RuntimeError('provider unavailable')
+
+    stub_llm.respond = fail
+    speculation = _speculation(pid_path)
+
+    assert speculation.take_result(JTBD_REQUEST) is None
+    assert speculation.status == 'failed'
+
+
+def test_unused_run_reports_its_usage(pid_path, stub_llm):
+    def cancel(step):
+        raise CrewCancelledError("Refinement cancelled")
+
+    speculation = _speculation(pid_path, cancel)
+    speculation.shutdown()
+
+    assert speculation.status == 'unused'
+    usage = speculation.token_usage()
+    assert usage['prompt_tokens'] == stub_llm.PROMPT_TOKENS
+    assert usage['completion_tokens'] == stub_llm.COMPLETION_TOKENS
+
+
+def test_delegation_is_served_through_the_speculative_agent(pid_path, stub_llm):
+    stub_llm.respond = lambda messages: _final_answer('LIVE' if 'competitive' in str(messages) else 'SPECULATED')
+    expert = get_agent(create_jobs_to_be_done_expert_agent, 'gpt-4o', stream=False, agent_class=SpeculativeAgent)
+    expert.attach_speculation(_speculation(pid_path))
+    delegate = DelegateWorkTool(agents=[expert], description='Delegate work to a coworker')
+
+    assert delegate._run(task=JTBD_REQUEST, context=PID_CONTENT, coworker='Jobs-to-be-Done Expert') == 'SPECULATED'
+    # Only the speculative run reached the model
+    assert len(stub_llm.calls) == 1
+    assert delegate._run(task='Assess the competitive landscape', context=PID_CONTENT,
+                         coworker='Jobs-to-be-Done Expert') == 'LIVE'
+    assert len(stub_llm.calls) == 2
@@ -0,0 +1,39 @@
+"""Tests for routing streamed chunks to the run that owns the agent."""
+
+import uuid
+from types import SimpleNamespace
+
+from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+
+from product_crew.crew.streaming import stream_agent_output
+
+
+def emit_chunk(agent, chunk: str) -> None:
+    crewai_event_bus.emit(agent, LLMStreamChunkEvent(chunk=chunk, agent_id=str(agent.id)))
+
+
+def test_chunks_are_routed_to_the_run_of_the_emitting_agent(tmp_path):
+    first_agent, second_agent = SimpleNamespace(id=uuid.uuid4()), SimpleNamespace(id=uuid.uuid4())
+    first_chunks, second_chunks = [], []
+
+    with stream_agent_output([first_agent], tmp_path / 'first.md', first_chunks.append), \
+            stream_agent_output([second_agent], tmp_path / 'second.md', second_chunks.append):
+        emit_chunk(first_agent, 'Users ')
+        emit_chunk(second_agent, 'Metrics')
+        emit_chunk(first_agent, 'are retailers')
+
+    assert first_chunks == ['Users ', 'are retailers']
+    assert second_chunks == ['Metrics']
+    assert (tmp_path / 'first.md').read_text(encoding='utf-8') == 'Users are retailers'
+    assert (tmp_path / 'second.md').read_text(encoding='utf-8') == 'Metrics'
+
+
+def test_chunks_after_the_run_ends_are_dropped(tmp_path):
+    agent = SimpleNamespace(id=uuid.uuid4())
+    chunks = []
+
+    with stream_agent_output([agent], tmp_path / 'partial.md', chunks.append):
+        emit_chunk(agent, 'during')
+    emit_chunk(agent, 'after')
+
+    assert chunks == ['during']
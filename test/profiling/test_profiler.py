@@ -0,0 +1,67 @@
+"""Tests for CPU and memory profiling of refinement workloads."""
+
+import io
+import threading
+
+from product_crew.profiling.profiler import (
+    ALLOCATIONS_FILENAME, COLLAPSED_FILENAME, PSTATS_FILENAME, ThreadProfiler, profile_refinement
+)
+
+
+def work_in_worker_thread():
+    return sum(number * number for number in range(20000))
+
+
+def work_after_profiling():
+    return sum(number for number in range(20000))
+
+
+def _function_names(profiler):
+    return {key[2] for key in profiler.stats(io.StringIO()).stats}
+
+
+def test_worker_threads_are_profiled():
+    profiler = ThreadProfiler()
+    profiler.enable()
+    thread = threading.Thread(target=work_in_worker_thread)
+    thread.start()
+    thread.join()
+    profiler.disable()
+
+    assert 'work_in_worker_thread' in _function_names(profiler)
+
+
+def test_threads_outliving_the_run_are_not_profiled_afterwards():
+    resume = threading.Event()
+    done = threading.Event()
+
+    def pool_thread():
+        work_in_worker_thread()
+        resume.wait(5)
+        work_after_profiling()
+        done.set()
+
+    profiler = ThreadProfiler()
+    profiler.enable()
+    thread = threading.Thread(target=pool_thread, daemon=True)
+    thread.start()
+    profiler.disable()
+    resume.set()
+    assert done.wait(5)
+
+    assert 'work_after_profiling' not in _function_names(profiler)
+
+
+def test_profile_refinement_writes_profile_files(tmp_path):
+    def workload():
+        thread = threading.Thread(target=work_in_worker_thread)
+        thread.start()
+        thread.join()
+
+    report = profile_refinement(workload, tmp_path, runs=2, top=5, warmup=1)
+
+    assert report.runs == 2
+    assert report.peak_memory > 0
+    assert {path.name for path in report.files.values()} == {PSTATS_FILENAME, COLLAPSED_FILENAME, ALLOCATIONS_FILENAME}
+    assert 'work_in_worker_thread' in (tmp_path / COLLAPSED_FILENAME).read_text(encoding='utf-8')
+    assert report.top_functions
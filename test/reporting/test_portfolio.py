@@ -0,0 +1,49 @@
+"""Tests for the portfolio report over refinement outputs."""
+
+import os
+
+from product_crew.crew.assessment import DIMENSIONS
+from product_crew.reporting import write_portfolio_report
+from product_crew.reporting.portfolio import iter_portfolio
+
+
+def assessment_document(score: float, readiness: str, status: str, gaps: list) -> str:
+    sections = ''.join(f"### {number}. {dimension}\n**Status**: {status}\n\n"
+                       for number, dimension in enumerate(DIMENSIONS, start=1))
+    gap_items = ''.join(f"{number}. {gap}\n" for number, gap in enumerate(gaps, start=1))
+    return (f"# Assessment\n\n**Problem Understanding Score**: {score}/10\n"
+            f"**Readiness for Solution Development**: {readiness}\n\n{sections}"
+            f"## Priority Gaps\n{gap_items}")
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def test_report_aggregates_the_latest_output_of_each_pid(tmp_path):
+    write(tmp_path / 'launch.md', "# Launch\n")
+    write(tmp_path / 'launch-2025-01-01.md', assessment_document(3, 'Not Ready', 'Not Defined', ['**Value**: none']))
+    write(tmp_path / 'launch-2025-02-01.md', assessment_document(8, 'Ready', 'Well Defined', ['**Metrics**: vague']))
+    write(tmp_path / 'team' / 'pricing-2025-01-15.md',
+          assessment_document(4, 'Not Ready', 'Partially Defined', ['**Metrics**: none']))
+    write(tmp_path / 'requirements' / 'old-2025-01-01.md', assessment_document(1, 'Not Ready', 'Not Defined', []))
+    output_path = tmp_path / 'portfolio-report.md'
+
+    summary = write_portfolio_report(tmp_path, output_path)
+
+    assert summary.pids == 2
+    assert summary.average_score == 6.0
+    assert summary.readiness == {'Ready': 1, 'Not Ready': 1, 'Unknown': 0}
+    assert summary.statuses[DIMENSIONS[0]] == {'Well Defined': 1, 'Partially Defined': 1}
+    assert summary.gaps.most_common(1) == [('Metrics', 2)]
+    report = output_path.read_text(encoding='utf-8')
+    assert '`launch-2025-02-01.md`' in report
+    assert '### team/pricing' in report
+
+
+def test_symlinked_directories_are_not_followed(tmp_path):
+    write(tmp_path / 'docs' / 'launch-2025-02-01.md', assessment_document(8, 'Ready', 'Well Defined', []))
+    os.symlink(tmp_path / 'docs', tmp_path / 'docs' / 'loop', target_is_directory=True)
+
+    assert [entry.name for entry in iter_portfolio(tmp_path)] == ['docs/launch']
@@ -0,0 +1,97 @@
+"""Tests for the async library API."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from product_crew import api
+from product_crew.errors import InvalidInputError, OutputWriteError, RefinementCancelledError, RefinementError
+
+
+@pytest.fixture
+def pid_tree(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'requirements').mkdir()
+    pid_path = tmp_path / 'initiative.md'
+    pid_path.write_text("# Initiative\n\n## Users\n\nSmall retailers.\n", encoding='utf-8')
+    return tmp_path / 'requirements', pid_path
+
+
+def test_cancellation_waits_for_the_worker_thread(pid_tree, monkeypatch):
+    requirements_path, pid_path = pid_tree
+    worker_started = threading.Event()
+    worker_stopped = threading.Event()
+
+    def run_refinement(*args):
+        cancel_event = args[6]
+        worker_started.set()
+        cancel_event.wait(5)
+        # The crew only notices cancellation at its next agent step
+        time.sleep(0.1)
+        worker_stopped.set()
+
+    monkeypatch.setattr(api, '_run_refinement', run_refinement)
+
+    async def main():
+        task = asyncio.ensure_future(api.refine_pid(requirements_path, pid_path))
+        await asyncio.get_running_loop().run_in_executor(None, worker_started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return worker_stopped.is_set()
+
+    assert asyncio.run(main())
+
+
+@pytest.mark.parametrize('change, message', [
+    (lambda tree: {'requirements_path': tree / 'missing'}, 'Requirements path does not exist'),
+    (lambda tree: {'pid_path': tree / 'missing.md'}, 'PID path does not exist'),
+    (lambda tree: {'pid_path': tree / 'requirements'}, 'must be a markdown file'),
+    (lambda tree: {'model': ' '}, 'Model name cannot be empty'),
+    (lambda tree: {'model': 'claude-3-5-sonnet-20241022'}, 'Anthropic API key not found'),
+])
+def test_invalid_inputs_raise_before_running_the_crew(pid_tree, monkeypatch, change, message):
+    requirements_path, pid_path = pid_tree
+    monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+    monkeypatch.setattr(api, '_run_refinement', lambda *args: pytest.fail("crew should not run"))
+    arguments = {'requirements_path': requirements_path, 'pid_path': pid_path, 'model': 'gpt-4o',
+                 **change(requirements_path.parent)}
+
+    with pytest.raises(InvalidInputError, match=message):
+        api.refine_pid_sync(arguments.pop('requirements_path'), arguments.pop('pid_path'), **arguments)
+
+
+@pytest.mark.parametrize('raised, expected', [
+    (RuntimeError('rate limited'), RefinementError),
+    (OutputWriteError('disk full'), OutputWriteError),
+])
+def test_crew_failures_raise_typed_errors(pid_tree, monkeypatch, raised, expected):
+    requirements_path, pid_path = pid_tree
+
+    def execute_refinement(*args, **kwargs):
+        raise raised
+
+    monkeypatch.setattr(api, 'execute_refinement', execute_refinement)
+
+    with pytest.raises(expected) as error:
+        api.refine_pid_sync(requirements_path, pid_path)
+    assert error.type is expected
+
+
+def test_cancellation_during_kickoff_raises_refinement_cancelled(pid_tree, stub_llm):
+    requirements_path, pid_path = pid_tree
+    cancel_event = threading.Event()
+    answer = stub_llm.respond
+
+    def respond(messages):
+        cancel_event.set()
+        return answer(messages)
+
+    stub_llm.respond = respond
+
+    with pytest.raises(RefinementCancelledError):
+        api._run_refinement(requirements_path, pid_path, False, 'gpt-4o', False, True, cancel_event, None,
+                            False, False, False, None, None)
@@ -0,0 +1,114 @@
+"""Tests for PID discovery and incremental builds."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from product_crew import api
+from product_crew.build import build, discover_pids
+from product_crew.errors import InvalidInputError
+
+
+@pytest.fixture
+def pid_tree(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'requirements').mkdir()
+    (tmp_path / 'requirements' / 'context.md').write_text("Requirements\n", encoding='utf-8')
+    (tmp_path / 'launch.md').write_text("# Launch\n\n## Users\n\nSmall retailers.\n", encoding='utf-8')
+    (tmp_path / 'pricing.md').write_text("# Pricing\n\n## Users\n\nFinance teams.\n", encoding='utf-8')
+    return tmp_path
+
+
+@pytest.fixture
+def refinements(monkeypatch):
+    """Replace the crew with one writing a dated output, recording the PIDs it refines."""
+    refined = []
+
+    async def refine_pid(requirements_path, pid_path, model='gpt-4o'):
+        refined.append(pid_path.name)
+        output_path = pid_path.with_name(f"{pid_path.stem}-2026-01-01.md")
+        output_path.write_text(f"Refined {pid_path.name}\n", encoding='utf-8')
+        return SimpleNamespace(output_path=output_path)
+
+    monkeypatch.setattr(api, 'refine_pid', refine_pid)
+    return refined
+
+
+def test_discover_pids_skips_outputs_requirements_and_hidden_folders(tmp_path):
+    for name in ('launch.md', 'launch-2025-01-31.md', 'release-2025-02-01.md', 'built.md',
+                 'requirements/context.md', '.drafts/draft.md'):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("# PID\n", encoding='utf-8')
+
+    pids = discover_pids(tmp_path, ['built.md'])
+
+    # A dated name without an undated source next to it is a PID, not a refine output
+    assert [path.name for path in pids] == ['launch.md', 'release-2025-02-01.md']
+
+
+def test_build_refines_only_pids_whose_inputs_changed(pid_tree, refinements):
+    first = build(pid_tree, jobs=1)
+    assert sorted(path.name for path in first.refined) == ['launch.md', 'pricing.md']
+
+    second = build(pid_tree, jobs=1)
+    assert second.refined == []
+    assert sorted(path.name for path in second.up_to_date) == ['launch.md', 'pricing.md']
+
+    (pid_tree / 'pricing.md').write_text("# Pricing\n\n## Users\n\nProcurement.\n", encoding='utf-8')
+    third = build(pid_tree, jobs=1)
+    assert [path.name for path in third.refined] == ['pricing.md']
+    assert len(refinements) == 3
+
+
+def test_build_checks_the_api_key_before_refining(pid_tree, refinements, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY')
+
+    assert len(build(pid_tree, dry_run=True).refined) == 2
+    with pytest.raises(InvalidInputError):
+        build(pid_tree)
+    assert refinements == []
+
+
+def test_pid_arriving_during_a_build_preempts_less_urgent_work(pid_tree, monkeypatch):
+    (pid_tree / 'pricing.md').unlink()
+    (pid_tree / 'launch.md').write_text("# Launch\nPriority: low\n\n## Users\n\nRetailers.\n", encoding='utf-8')
+    events = []
+
+    async def refine_pid(requirements_path, pid_path, model='gpt-4o'):
+        events.append(f"start {pid_path.name}")
+        if pid_path.name == 'launch.md' and not (pid_tree / 'urgent.md').exists():
+            (pid_tree / 'urgent.md').write_text("# Urgent\nPriority: critical\n\n## Users\n\nBanks.\n",
+                                                 encoding='utf-8')
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                events.append('preempted launch.md')
+                raise
+        output_path = pid_path.with_name(f"{pid_path.stem}-2026-01-01.md")
+        output_path.write_text(f"Refined {pid_path.name}\n", encoding='utf-8')
+        return SimpleNamespace(output_path=output_path)
+
+    monkeypatch.setattr(api, 'refine_pid', refine_pid)
+
+    report = build(pid_tree, jobs=1, rescan_interval=0.05)
+
+    assert events == ['start launch.md', 'preempted launch.md', 'start urgent.md', 'start launch.md']
+    assert [path.name for path in report.refined] == ['urgent.md', 'launch.md']
+    assert build(pid_tree, jobs=1, rescan_interval=0.05).refined == []
+
+
+def test_build_without_rescans_does_not_pick_up_new_pids(pid_tree, refinements, monkeypatch):
+    write_output = api.refine_pid
+
+    async def refine_pid(requirements_path, pid_path, model='gpt-4o'):
+        (pid_tree / 'urgent.md').write_text("# Urgent\nPriority: critical\n", encoding='utf-8')
+        return await write_output(requirements_path, pid_path, model)
+
+    monkeypatch.setattr(api, 'refine_pid', refine_pid)
+
+    report = build(pid_tree, jobs=1, rescan_interval=0)
+
+    assert sorted(path.name for path in report.refined) == ['launch.md', 'pricing.md']
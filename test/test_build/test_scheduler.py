@@ -0,0 +1,146 @@
+"""Tests for priority-, deadline- and cost-aware scheduling of refinement jobs."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from product_crew.build.scheduler import (
+    DEFAULT_PRIORITY, MAX_PREEMPTIONS, Job, RefinementScheduler, read_schedule_metadata
+)
+
+
+def _run(jobs, run_job, workers=1):
+    return asyncio.run(RefinementScheduler(run_job, workers).run(jobs))
+
+
+def _order(jobs, workers=1):
+    started = []
+
+    async def run_job(job):
+        started.append(job.pid_path.name)
+
+    _run(jobs, run_job, workers)
+    return started
+
+
+def test_front_matter_metadata():
+    content = "---\npriority: high  # urgent\ndeadline: 2026-11-01\n---\n# Initiative\n"
+
+    assert read_schedule_metadata(content) == (1, datetime(2026, 11, 1))
+
+
+def test_header_metadata():
+    content = "# Initiative\n\n**Priority**: P0\nDeadline: 2026-11-01T12:00\n\n## Problem\n\nText.\n"
+
+    assert read_schedule_metadata(content) == (0, datetime(2026, 11, 1, 12))
+
+
+def test_body_fields_are_ignored():
+    content = ("# Initiative\n\n## Risks\n\n- **Priority**: critical\n"
+               "Priority: low\n\n| Priority | high |\n")
+
+    assert read_schedule_metadata(content) == (DEFAULT_PRIORITY, None)
+
+
+def test_orders_by_priority_then_deadline_then_cost():
+    jobs = [
+        Job(Path('normal-large.md'), priority=2, estimated_tokens=9000),
+        Job(Path('normal-small.md'), priority=2, estimated_tokens=4000),
+        Job(Path('low.md'), priority=3, estimated_tokens=0),
+        Job(Path('normal-late.md'), priority=2, deadline=datetime(2026, 12, 1), estimated_tokens=1),
+        Job(Path('normal-soon.md'), priority=2, deadline=datetime(2026, 11, 1), estimated_tokens=99999),
+        Job(Path('high.md'), priority=1, estimated_tokens=50000),
+    ]
+
+    assert _order(jobs) == ['high.md', 'normal-soon.md', 'normal-late.md', 'normal-small.md',
+                            'normal-large.md', 'low.md']
+
+
+def test_submission_order_breaks_ties():
+    jobs = [Job(Path(f"pid-{number}.md"), estimated_tokens=100) for number in range(5)]
+
+    assert _order(jobs) == [f"pid-{number}.md" for number in range(5)]
+
+
+def test_failed_job_keeps_its_error():
+    async def run_job(job):
+        raise ValueError('boom')
+
+    completed = _run([Job(Path('pid.md'))], run_job)
+
+    assert isinstance(completed[0].error, ValueError)
+    assert completed[0].time_to_result is not None
+
+
+def test_preempted_job_is_requeued_after_it_stops():
+    events = []
+    running = set()
+    low_started = asyncio.Event()
+
+    async def run_job(job):
+        name = job.pid_path.name
+        assert name not in running, f"{name} runs twice at once"
+        running.add(name)
+        events.append(f"start {name}")
+        if name == 'low.md':
+            low_started.set()
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            # Like refine_pid, wind the work down before reporting the cancellation
+            await asyncio.sleep(0.02)
+            events.append(f"stopped {name}")
+            raise
+        finally:
+            running.discard(name)
+        events.append(f"done {name}")
+        return name
+
+    async def main():
+        scheduler = RefinementScheduler(run_job, workers=1)
+        await scheduler.submit(Job(Path('low.md'), priority=3))
+        runner = asyncio.ensure_future(scheduler.run(close=False))
+        await low_started.wait()
+        await scheduler.submit(Job(Path('high.md'), priority=1))
+        await scheduler.close()
+        return await runner
+
+    completed = asyncio.run(main())
+
+    assert events == ['start low.md', 'stopped low.md', 'start high.md', 'done high.md',
+                      'start low.md', 'done low.md']
+    assert [job.pid_path.name for job in completed] == ['high.md', 'low.md']
+    assert completed[1].preemptions == 1
+    assert completed[1].result == 'low.md'
+
+
+def test_preemption_is_capped():
+    events = []
+    low_started = asyncio.Event()
+
+    async def run_job(job):
+        name = job.pid_path.name
+        events.append(f"start {name}")
+        if name == 'low.md':
+            low_started.set()
+        await asyncio.sleep(0.02)
+
+    async def main():
+        scheduler = RefinementScheduler(run_job, workers=1)
+        await scheduler.submit(Job(Path('low.md'), priority=3))
+        runner = asyncio.ensure_future(scheduler.run(close=False))
+        for number in range(MAX_PREEMPTIONS + 1):
+            await low_started.wait()
+            low_started.clear()
+            await scheduler.submit(Job(Path(f"high-{number}.md"), priority=1))
+        await scheduler.close()
+        return await runner
+
+    completed = asyncio.run(main())
+
+    # Once preempted MAX_PREEMPTIONS times, the low priority job runs to completion
+    low = completed[-2]
+    assert low.pid_path.name == 'low.md'
+    assert low.preemptions == MAX_PREEMPTIONS
+    assert events.count('start low.md') == MAX_PREEMPTIONS + 1
+    assert completed[-1].pid_path.name == f"high-{MAX_PREEMPTIONS}.md"